@@ -17,11 +17,30 @@ Run: python src/01_first_agent.py
 
 import os
 import sys
+import json
+import asyncio
+import time
+import hashlib
+import sqlite3
+import tempfile
+import functools
+import contextlib
+import importlib.util
 from datetime import datetime
 from typing import Optional
-from openai import OpenAI
 from dotenv import load_dotenv
 
+# Heavy SDKs (openai, httpx, tenacity, numpy, pydantic) are imported where they're
+# first used, so the welcome screen and "no API key" check appear instantly
+
+# numpy is only needed for the optional semantic cache
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+try:
+    import fcntl  # POSIX only: cross-process request coalescing
+except ImportError:
+    fcntl = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -37,60 +56,488 @@ class AgentConfig:
     MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
     TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
     
+    # Max API requests in flight at once (keep under your rate limit)
+    CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "8"))
+    
+    # Routing hint for OpenAI's prompt cache. The research prompt (~180
+    # tokens) is below the 1024-token caching minimum, so nothing is cached
+    # today; the key only matters if the shared prefix grows past that
+    PROMPT_CACHE_KEY = "research-v2"
+    
     # Output settings
     OUTPUT_DIR = "outputs"
     
-    # System prompt for research
-    RESEARCH_PROMPT = """You are a company research agent helping someone prepare for a job interview.
+    # Cache settings (re-running the same company skips the API call)
+    USE_CACHE = os.getenv("AGENT_CACHE", "true").lower() == "true"
+    CACHE_DIR = os.path.join(OUTPUT_DIR, ".cache")
+    
+    # Semantic cache: also match near-duplicate names ("Stripe Inc." ≈ "stripe")
+    SEMANTIC_CACHE = os.getenv("SEMANTIC_CACHE", "false").lower() == "true"
+    EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+    SIMILARITY_THRESHOLD = 0.93
+    
+    # Reference prior research: hand the model excerpts of saved reports on
+    # related companies (embedding search over outputs/.cache/report_index.npz)
+    REFERENCE_PRIOR_RESEARCH = os.getenv("REFERENCE_PRIOR_RESEARCH", "false").lower() == "true"
+    REFERENCE_TOP_K = 3
+    REFERENCE_MIN_SIMILARITY = 0.6
+    REFERENCE_MAX_CHARS = 2000  # ~500 tokens per excerpt
+    
+    # Validation: a structural check of the report (no LLM call needed)
+    REQUIRED_SECTIONS = [
+        "## 1. Company Overview",
+        "## 2. Products & Services",
+        "## 3. Culture & Values",
+        "## 4. Recent Developments",
+        "## 5. Interview Preparation Tips"
+    ]
+    MIN_SECTION_CHARS = 200
+    
+    # Escape hatch: validate with a second LLM call instead
+    # (a small model is plenty for a yes/no structural check)
+    USE_LLM_VALIDATION = os.getenv("LLM_VALIDATION", "false").lower() == "true"
+    VALIDATION_MODEL = os.getenv("OPENAI_VALIDATION_MODEL", "gpt-4o-mini")
+    
+    # Structured output: the model returns JSON matching CompanyReport, which
+    # is validated and rendered to markdown locally (no streaming in this mode)
+    STRUCTURED_OUTPUT = os.getenv("STRUCTURED_OUTPUT", "false").lower() == "true"
+    
+    # Marks the self-validation verdict appended after the report
+    VALIDATION_MARKER = "===VALIDATION==="
+    
+    # Separates reports when several companies are researched in one call
+    BATCH_SEPARATOR = "---RECORD|||SEP|||BOUNDARY---"
+    
+    # A batched call returns nothing until every report is written, so its
+    # read timeout grows with the batch instead of using the shared 60 s
+    BATCH_TIMEOUT_PER_COMPANY = 45.0  # seconds
+    
+    # System prompt for research, written as a terse spec: every call pays
+    # for these tokens. It also asks the model to validate its own report,
+    # so one API call does the work of two.
+    RESEARCH_PROMPT = f"""ROLE: company research for job-interview prep.
+OUTPUT: markdown. H2 headings verbatim, in this order (cover the bracketed points):
+## 1. Company Overview [what they do, founded, HQ, size, key leaders]
+## 2. Products & Services [offerings, target customers, competitive edge]
+## 3. Culture & Values [mission, values, work environment, perks]
+## 4. Recent Developments [last 12-18 mo: news, funding, launches, leadership changes, controversies]
+## 5. Interview Preparation Tips [what they look for, common themes, showing fit, red flags]
+STYLE: bullets, concise, specific, useful for standing out in an interview.
+END: new line {VALIDATION_MARKER} then COMPLETE, or INCOMPLETE: <what's missing or too brief>."""
+
+    # System prompt for structured output (the JSON schema defines the sections)
+    STRUCTURED_PROMPT = """ROLE: company research for job-interview prep.
+OUTPUT: JSON matching the schema; fill every field.
+recent: last 12-18 mo - news, funding, launches, leadership changes, controversies.
+STYLE: concise, specific, useful for standing out in an interview."""
+
+    VALIDATION_PROMPT = """ROLE: QA for company research reports.
+CHECK: all 5 sections present and adequate: 1 Company Overview (what, founded, leaders), 2 Products & Services, 3 Culture & Values, 4 Recent Developments, 5 Interview Preparation Tips.
+REPLY exactly: COMPLETE, or INCOMPLETE: <what's missing or too brief>."""
+
+
+# ==========================================================
+# STRUCTURED OUTPUT (optional, see AgentConfig.STRUCTURED_OUTPUT)
+# ==========================================================
+
+@functools.lru_cache(maxsize=None)
+def report_model():
+    """
+    Define the CompanyReport model on first use (pydantic imports lazily).
+    
+    Only structured mode needs it, so markdown runs never import pydantic.
+    """
+    from pydantic import BaseModel, ConfigDict
+    
+    class _Strict(BaseModel):
+        """Base for report models: OpenAI strict mode forbids extra fields."""
+        model_config = ConfigDict(extra="forbid")
+    
+    class Overview(_Strict):
+        what_they_do: str
+        founded: str
+        headquarters: str
+        size: str
+        key_leadership: list[str]
+    
+    class Products(_Strict):
+        main_offerings: list[str]
+        target_customers: list[str]
+        competitive_advantages: list[str]
+    
+    class Culture(_Strict):
+        mission: str
+        core_values: list[str]
+        work_environment: str
+        perks_and_practices: list[str]
+    
+    class InterviewPrep(_Strict):
+        what_they_look_for: list[str]
+        common_themes: list[str]
+        cultural_fit: list[str]
+        red_flags: list[str]
+    
+    class CompanyReport(_Strict):
+        """The research report as data, one field per report section."""
+        overview: Overview
+        products: Products
+        culture: Culture
+        recent: list[str]
+        interview_prep: InterviewPrep
+    
+    return CompanyReport
+
 
-Your job is to provide comprehensive, accurate, and actionable information.
+def _empty_fields(data: dict, prefix: str = "") -> list[str]:
+    """List the (dotted) names of fields with no content."""
+    empty = []
+    for name, value in data.items():
+        if isinstance(value, dict):
+            empty += _empty_fields(value, f"{prefix}{name}.")
+        elif not value or (isinstance(value, str) and not value.strip()):
+            empty.append(prefix + name)
+    return empty
+
+
+def render_report(report) -> str:
+    """Render a CompanyReport as the usual 5-section markdown (no LLM needed)."""
+    def bullets(items):
+        return "\n".join(f"- {item}" for item in items)
+    
+    o, p, c, i = report.overview, report.products, report.culture, report.interview_prep
+    overview, products, culture, recent, tips = AgentConfig.REQUIRED_SECTIONS
+    
+    return f"""{overview}
+- **What they do:** {o.what_they_do}
+- **Founded:** {o.founded}
+- **Headquarters:** {o.headquarters}
+- **Size:** {o.size}
+- **Key leadership:** {", ".join(o.key_leadership)}
 
-For each company, provide the following sections:
+{products}
+**Main offerings**
+{bullets(p.main_offerings)}
 
-## 1. Company Overview
-- What they do (core business/product)
-- Founded (year) and headquarters location
-- Size (employees, if known)
-- Key leadership
+**Target customers**
+{bullets(p.target_customers)}
 
-## 2. Products & Services
-- Main offerings
-- Target customers
-- Competitive advantages
+**Competitive advantages**
+{bullets(p.competitive_advantages)}
 
-## 3. Culture & Values
-- Company mission/vision
-- Core values
-- Work environment reputation
-- Notable perks or practices
+{culture}
+- **Mission:** {c.mission}
+- **Work environment:** {c.work_environment}
 
-## 4. Recent Developments (Last 12-18 months)
-- Major news, funding, acquisitions
-- Product launches
-- Leadership changes
-- Challenges or controversies
+**Core values**
+{bullets(c.core_values)}
 
-## 5. Interview Preparation Tips
-- What they likely look for in candidates
-- Common interview themes/questions
-- How to demonstrate cultural fit
-- Red flags to avoid
+**Perks & practices**
+{bullets(c.perks_and_practices)}
 
-Be concise but thorough. Use bullet points for clarity.
-Focus on information that would help someone stand out in an interview."""
+{recent}
+{bullets(report.recent)}
 
-    VALIDATION_PROMPT = """You are a quality checker for company research reports.
+{tips}
+**What they look for**
+{bullets(i.what_they_look_for)}
 
-Check if the research covers ALL of these required sections:
-1. Company Overview (what they do, when founded, leadership)
-2. Products & Services  
-3. Culture & Values
-4. Recent Developments
-5. Interview Preparation Tips
+**Common interview themes**
+{bullets(i.common_themes)}
 
-Respond with EXACTLY one of these formats:
-- "COMPLETE" if all sections are adequately covered
-- "INCOMPLETE: [list what's missing]" if sections are missing or too brief"""
+**Demonstrating cultural fit**
+{bullets(i.cultural_fit)}
+
+**Red flags to avoid**
+{bullets(i.red_flags)}"""
+
+
+# Shared HTTP connection pool: keep-alive reuses TCP/TLS connections
+# across requests, and explicit timeouts stop a stalled call hanging main()
+_SHARED_HTTPX = None
+
+
+def shared_http_client():
+    """Return the shared httpx.AsyncClient, creating it on first use."""
+    global _SHARED_HTTPX
+    if _SHARED_HTTPX is None:
+        import httpx
+        
+        _SHARED_HTTPX = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    return _SHARED_HTTPX
+
+
+# Retry transient API failures (429s, dropped connections, timeouts)
+# with exponential backoff + jitter, honoring the server's Retry-After
+_RETRYING = None
+
+
+def _retrying():
+    """Build the retry policy on first use (tenacity + openai import lazily)."""
+    global _RETRYING
+    if _RETRYING is None:
+        from openai import RateLimitError, APIConnectionError, APITimeoutError
+        from tenacity import (
+            AsyncRetrying, stop_after_attempt, wait_exponential_jitter,
+            retry_if_exception_type
+        )
+        
+        backoff = wait_exponential_jitter(initial=1, max=30)
+        
+        def wait_retry_after(retry_state) -> float:
+            """Wait as long as a 429's Retry-After header asks, else back off."""
+            error = retry_state.outcome.exception()
+            if isinstance(error, RateLimitError):
+                try:
+                    # Capped: a huge (or hostile) header mustn't stall the run
+                    return min(float(error.response.headers.get("retry-after")), 60.0)
+                except (TypeError, ValueError):
+                    pass
+            return backoff(retry_state)
+        
+        _RETRYING = AsyncRetrying(
+            stop=stop_after_attempt(5),
+            wait=wait_retry_after,
+            retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+            reraise=True
+        )
+    return _RETRYING
+
+
+def retry_transient(func):
+    """Decorator: retry an async API call on transient errors."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await _retrying().copy()(func, *args, **kwargs)
+    return wrapper
+
+
+# Filename-safe company slugs in one pass ("Checkout.com" -> "checkoutcom")
+_SLUG_TABLE = str.maketrans({" ": "_", ".": "", "/": "_", ",": "", "'": ""})
+
+
+# ==========================================================
+# CACHE (BUILDING BLOCK 4: MEMORY, across runs)
+# ==========================================================
+
+def cache_key(*parts) -> str:
+    """Build a stable cache key from everything that affects the LLM output."""
+    raw = "|".join(str(part) for part in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+@contextlib.asynccontextmanager
+async def process_lock(path: str):
+    """
+    Hold an exclusive advisory lock on path, shared across processes.
+    
+    Waiting happens in a worker thread so the event loop keeps running.
+    Without fcntl (Windows) this is a no-op.
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as handle:
+        await asyncio.to_thread(fcntl.flock, handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class LLMCache:
+    """
+    On-disk cache for LLM responses, backed by SQLite.
+    
+    - Exact lookups: key = sha256(model | temperature | prompt | input)
+    - Semantic lookups (optional): cosine similarity over embeddings
+      of previously researched company names, only among entries in
+      the same namespace (model | temperature | prompt)
+    """
+    
+    TABLES = ("research", "validation")
+    
+    def __init__(self, path: Optional[str] = None):
+        path = path or os.path.join(AgentConfig.CACHE_DIR, "llm_cache.sqlite")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        self.conn = sqlite3.connect(path)
+        for table in self.TABLES:
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, payload TEXT, ts REAL)"
+            )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, vector TEXT, namespace TEXT)"
+        )
+        self.conn.commit()
+        
+        # In-memory embedding matrices per namespace, loaded on first lookup
+        self._matrices: dict[str, tuple] = {}
+    
+    def get(self, key: str, table: str = "research") -> Optional[str]:
+        """Return the cached payload for key, or None."""
+        row = self.conn.execute(
+            f"SELECT payload FROM {table} WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, value: str, table: str = "research"):
+        """Store a payload under key."""
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {table} (key, payload, ts) VALUES (?, ?, ?)",
+            (key, value, time.time())
+        )
+        self.conn.commit()
+    
+    def _load_embeddings(self, namespace: str) -> tuple:
+        """Load a namespace's embeddings as (keys, normalized numpy matrix)."""
+        import numpy as np
+        
+        rows = self.conn.execute(
+            "SELECT key, vector FROM embeddings WHERE namespace = ?", (namespace,)
+        ).fetchall()
+        if not rows:
+            return [], None
+        
+        matrix = np.array([json.loads(vector) for _, vector in rows], dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        return [key for key, _ in rows], matrix
+    
+    def add_embedding(self, key: str, vector: list, namespace: str):
+        """Remember the embedding of the input that produced key."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO embeddings (key, vector, namespace) VALUES (?, ?, ?)",
+            (key, json.dumps(vector), namespace)
+        )
+        self.conn.commit()
+        self._matrices.pop(namespace, None)  # Reload on next lookup
+    
+    def most_similar(self, vector: list, threshold: float, namespace: str) -> Optional[str]:
+        """
+        Return the key of the closest stored embedding above threshold.
+        
+        Only entries stored under the same namespace are considered, so a
+        different model, prompt or output mode never matches.
+        """
+        import numpy as np
+        
+        if namespace not in self._matrices:
+            self._matrices[namespace] = self._load_embeddings(namespace)
+        keys, matrix = self._matrices[namespace]
+        if not keys:
+            return None
+        
+        query = np.asarray(vector, dtype=np.float32)
+        query /= np.linalg.norm(query)
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        
+        if similarities[best] > threshold:
+            return keys[best]
+        return None
+
+
+class ReportIndex:
+    """
+    Embeddings of saved reports, so related prior research can be found.
+    
+    Stored as one .npz file: company names, report paths and a matrix
+    of normalized embeddings (one row per report).
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(AgentConfig.CACHE_DIR, "report_index.npz")
+        self.companies: list[str] = []
+        self.paths: list[str] = []
+        self.vectors = None
+        
+        if os.path.exists(self.path):
+            import numpy as np
+            
+            with np.load(self.path) as data:
+                self.companies = data["companies"].tolist()
+                self.paths = data["paths"].tolist()
+                self.vectors = data["vectors"]
+    
+    def add(self, company: str, report_path: str, vector: list):
+        """
+        Add a report to the index and persist it.
+        
+        Each company has one row: a newer report replaces the older one,
+        so re-researching a company never stacks copies of its report.
+        """
+        import numpy as np
+        
+        row = np.asarray(vector, dtype=np.float32)
+        row /= np.linalg.norm(row)
+        
+        keep = [i for i, name in enumerate(self.companies) if name.lower() != company.lower()]
+        if len(keep) < len(self.companies):
+            self.companies = [self.companies[i] for i in keep]
+            self.paths = [self.paths[i] for i in keep]
+            self.vectors = self.vectors[keep] if keep else None
+        
+        self.companies.append(company)
+        self.paths.append(report_path)
+        self.vectors = row[None, :] if self.vectors is None else np.vstack([self.vectors, row])
+        self._save()
+    
+    def _save(self):
+        """Write the index atomically (temp file + rename)."""
+        import numpy as np
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(self.path),
+            suffix=".npz.tmp",
+            delete=False
+        )
+        try:
+            with tmp:
+                np.savez(
+                    tmp,
+                    companies=np.array(self.companies),
+                    paths=np.array(self.paths),
+                    vectors=self.vectors
+                )
+            os.replace(tmp.name, self.path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+    
+    def search(self, vector: list, exclude: str = "") -> list[tuple[str, str]]:
+        """
+        Return (company, report_path) for the closest reports.
+        
+        At most REFERENCE_TOP_K results, each above REFERENCE_MIN_SIMILARITY;
+        reports on the excluded company itself are skipped.
+        """
+        import numpy as np
+        
+        if self.vectors is None:
+            return []
+        
+        query = np.asarray(vector, dtype=np.float32)
+        query /= np.linalg.norm(query)
+        similarities = self.vectors @ query
+        
+        matches = []
+        for i in np.argsort(-similarities):
+            if similarities[i] <= AgentConfig.REFERENCE_MIN_SIMILARITY:
+                break
+            if self.companies[i].lower() == exclude.lower():
+                continue
+            matches.append((self.companies[i], self.paths[i]))
+            if len(matches) == AgentConfig.REFERENCE_TOP_K:
+                break
+        return matches
 
 
 # ==========================================================
@@ -109,7 +556,7 @@ class CompanyResearchAgent:
     """
     
     def __init__(self, api_key: Optional[str] = None):
-        """Initialize the agent with OpenAI client."""
+        """Initialize the agent with an async OpenAI client."""
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         
         if not self.api_key:
@@ -119,7 +566,15 @@ class CompanyResearchAgent:
             )
         
         # Initialize the LLM client (BUILDING BLOCK 2: REASONING)
-        self.client = OpenAI(api_key=self.api_key)
+        # (max_retries=0: retries are handled by retry_transient instead)
+        from openai import AsyncOpenAI
+        
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=shared_http_client(),
+            max_retries=0
+        )
+        self._semaphore = asyncio.Semaphore(AgentConfig.CONCURRENCY)
         
         # Initialize memory (BUILDING BLOCK 4: MEMORY)
         self.memory = {
@@ -127,147 +582,787 @@ class CompanyResearchAgent:
             "current_research": None,
             "history": []
         }
+        
+        # Persistent response cache (memory that survives restarts)
+        self.cache = LLMCache() if AgentConfig.USE_CACHE else None
+        
+        # Index of saved reports, for referencing related prior research
+        self.report_index = (
+            ReportIndex() if AgentConfig.REFERENCE_PRIOR_RESEARCH and HAS_NUMPY else None
+        )
+        
+        # Research requests in flight, so duplicates can share the result
+        self._inflight: dict[str, asyncio.Future] = {}
+        
+        # Token usage, to see whether OpenAI's prompt cache is ever hit
+        self.usage = {"prompt_tokens": 0, "cached_tokens": 0}
     
-    def research(self, company_name: str) -> dict:
+    async def research(self, company_name: str, stream: bool = False) -> dict:
         """
         Research a company and return structured results.
         
         Args:
             company_name: Name of the company to research
+            stream: Print the report to stdout as it's generated
+                (leave off when researching several companies at once)
             
         Returns:
             Dictionary containing research results and metadata
         """
+        # One timestamp per research, reused for the record and the filename
+        started = datetime.now()
+        
         print(f"\n{'='*60}")
         print(f"🤖 AGENT ACTIVATED")
         print(f"{'='*60}")
         print(f"📎 Goal: Research '{company_name}' for interview prep")
-        print(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"🕐 Started: {started.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}\n")
         
-        # BUILDING BLOCK 1: GOAL
-        goal = f"Research {company_name} for job interview preparation"
-        
         # BUILDING BLOCK 2: REASONING (via LLM)
         print("📊 Step 1/3: Gathering company information...")
-        research_output = self._execute_research(company_name)
+        research_output, verdict = await self._execute_research(company_name, stream)
+        
+        return await self._finish_research(company_name, research_output, verdict, started)
+    
+    async def _finish_research(
+        self,
+        company_name: str,
+        research_output: str,
+        verdict: Optional[str],
+        started: Optional[datetime] = None
+    ) -> dict:
+        """Validate a research output and store it in memory."""
+        started = started or datetime.now()
+        
+        # BUILDING BLOCK 1: GOAL
+        goal = f"Research {company_name} for job interview preparation"
         
         # BUILDING BLOCK 4: MEMORY - Store results
-        self.memory["current_research"] = {
+        # (a local record, so concurrent research() calls don't clobber each other)
+        record = {
             "company": company_name,
             "goal": goal,
             "research": research_output,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": started.isoformat(),
             "status": "pending_validation"
         }
+        self.memory["current_research"] = record
         
         # BUILDING BLOCK 5: FEEDBACK LOOP - Validate quality
+        # (the research call already returned a verdict; only ask again if it didn't)
         print("✅ Step 2/3: Validating research completeness...")
-        validation_result = self._validate_research(research_output)
+        validation_result = verdict or await self._validate_research(research_output)
         
         # Update status based on validation
         if "INCOMPLETE" in validation_result:
-            self.memory["current_research"]["status"] = "needs_review"
-            self.memory["current_research"]["validation_notes"] = validation_result
+            record["status"] = "needs_review"
+            record["validation_notes"] = validation_result
             print(f"⚠️  Validation: {validation_result}")
         else:
-            self.memory["current_research"]["status"] = "complete"
+            record["status"] = "complete"
             print("✅ Validation: Research is complete")
         
-        # Add to history
+        # Add to history (metadata only - the full report lives on disk
+        # once saved, so memory stays flat over a long session)
         self.memory["researched_companies"].append(company_name)
-        self.memory["history"].append(self.memory["current_research"].copy())
+        self.memory["history"].append({
+            "company": company_name,
+            "timestamp": record["timestamp"],
+            "status": record["status"],
+            "report_path": None,
+            "validation_notes": record.get("validation_notes")
+        })
         
         print("\n📝 Step 3/3: Preparing output...")
         
-        return self.memory["current_research"]
+        return record
     
-    def _execute_research(self, company_name: str) -> str:
-        """Execute the research using the LLM."""
+    async def research_many(self, company_names: list[str]) -> list[dict]:
+        """
+        Research several companies concurrently.
+        
+        Requests overlap on the network; the semaphore keeps the number
+        in flight under AgentConfig.CONCURRENCY.
+        """
+        return await asyncio.gather(*(self.research(name) for name in company_names))
+    
+    async def research_batch(self, company_names: list[str], batch_size: int = 8) -> list[dict]:
+        """
+        Research many companies with one API call per batch.
+        
+        The system prompt is sent once per batch instead of once per company,
+        and batches run concurrently. A batch whose output can't be split
+        back into one report per company falls back to per-company calls.
+        """
+        batches = [
+            company_names[start:start + batch_size]
+            for start in range(0, len(company_names), batch_size)
+        ]
+        results = await asyncio.gather(*(self._research_chunk(batch) for batch in batches))
+        return [record for batch_records in results for record in batch_records]
+    
+    async def _research_chunk(self, company_names: list[str]) -> list[dict]:
+        """
+        Research one batch of companies, falling back to one call each.
+        
+        Companies that are cached or already being researched don't take
+        a slot in the batch; only the misses are sent to the LLM.
+        """
+        if AgentConfig.STRUCTURED_OUTPUT:  # One JSON object per call
+            return await self.research_many(company_names)
+        
+        results = {}  # name -> (report, verdict)
+        shared = {}   # name -> in-flight future from another request
+        claimed = {}  # key -> (name, our in-flight future)
+        aliases = {}  # name -> earlier name with the same key ("Stripe" / "stripe")
+        
+        # Claim every uncached key before the first await, so a concurrent
+        # batch sees them in flight instead of researching them again
+        loop = asyncio.get_running_loop()
+        for name in dict.fromkeys(company_names):
+            key = self._research_key(name)
+            if key in claimed:
+                aliases[name] = claimed[key][0]
+                continue
+            if key in self._inflight:
+                print(f"⏳ Research on '{name}' already in flight - sharing it")
+                shared[name] = asyncio.shield(self._inflight[key])
+                continue
+            
+            cached = None
+            if self.cache:
+                try:
+                    cached = self.cache.get(key)
+                except Exception:
+                    pass  # A failed lookup is just a miss
+            if cached is not None:
+                print(f"⚡ Cache hit: reusing previous research on '{name}'")
+                results[name] = self._parse_output(cached)
+            else:
+                self._inflight[key] = loop.create_future()
+                claimed[key] = (name, self._inflight[key])
+        
+        try:
+            if claimed:
+                results.update(await self._research_claimed(claimed))
+        except BaseException:
+            for _, future in claimed.values():
+                future.cancel()
+            raise
+        finally:
+            for key, (_, future) in claimed.items():
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+        
+        for name, outcome in zip(shared, await asyncio.gather(*shared.values())):
+            results[name] = outcome
+        for name, first in aliases.items():
+            results[name] = results[first]
+        
+        return await asyncio.gather(*(
+            self._finish_research(name, *results[name])
+            for name in company_names
+        ))
+    
+    async def _research_claimed(self, claimed: dict) -> dict:
+        """
+        Research companies whose keys this batch has claimed as in flight.
+        
+        Semantic cache hits are served first; the rest go out in one call
+        (or one call each, if the batch output doesn't split cleanly).
+        Each claimed future is resolved with its company's result.
+        """
+        lookups = [(None, None)] * len(claimed)
+        if self.cache:
+            lookups = await asyncio.gather(
+                *(self._similar_research(name) for name, _ in claimed.values()),
+                return_exceptions=True
+            )
+        
+        results = {}
+        misses = []  # (name, key, name embedding or None)
+        for (key, (name, future)), lookup in zip(claimed.items(), lookups):
+            cached, embedding = (None, None) if isinstance(lookup, BaseException) else lookup
+            if cached is not None:
+                print(f"⚡ Cache hit: reusing previous research on '{name}'")
+                results[name] = self._parse_output(cached)
+                future.set_result(results[name])
+            else:
+                misses.append((name, key, embedding))
+        
+        if not misses:
+            return results
+        
+        names = [name for name, _, _ in misses]
+        outputs = await self._execute_batch(names)
+        if outputs is None:
+            print(f"⚠️  Batch output didn't split cleanly - "
+                  f"researching {len(names)} companies individually")
+            outputs = await asyncio.gather(*(
+                self._fetch_research(name, key, stream=False)
+                for name, key, _ in misses
+            ))
+        elif self.cache:
+            for _, key, embedding in misses:
+                if embedding is not None:
+                    self.cache.add_embedding(key, embedding, self._research_namespace())
+        
+        for (name, key, _), outcome in zip(misses, outputs):
+            claimed[key][1].set_result(outcome)
+            results[name] = outcome
+        return results
+    
+    @retry_transient
+    async def _chat(self, **kwargs):
+        """
+        Create a chat completion, retrying transient errors.
+        
+        The semaphore is held per attempt, not while backing off.
+        """
+        return await self._chat_once(**kwargs)
+    
+    async def _chat_once(self, **kwargs):
+        """
+        Create a chat completion (a single attempt) and record its usage.
+        
+        Streaming calls don't take the semaphore here: the caller holds it
+        until the stream has been consumed (see _stream_completion).
+        """
+        if kwargs.get("stream"):
+            return await self.client.chat.completions.create(**kwargs)
+        
+        async with self._semaphore:
+            response = await self.client.chat.completions.create(**kwargs)
+        
+        self._record_usage(response.usage)
+        return response
+    
+    def _record_usage(self, usage):
+        """Add a response's token usage to the running totals."""
+        if usage is None:
+            return
+        self.usage["prompt_tokens"] += usage.prompt_tokens
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.usage["cached_tokens"] += getattr(details, "cached_tokens", None) or 0
+    
+    @property
+    def prompt_cache_hit_rate(self) -> float:
+        """Fraction of input tokens served from OpenAI's prompt cache."""
+        if not self.usage["prompt_tokens"]:
+            return 0.0
+        return self.usage["cached_tokens"] / self.usage["prompt_tokens"]
+    
+    @retry_transient
+    async def _embed(self, text: str) -> list:
+        """Embed text for semantic cache and report index lookups."""
+        async with self._semaphore:
+            response = await self.client.embeddings.create(
+                model=AgentConfig.EMBEDDING_MODEL,
+                input=text
+            )
+        return response.data[0].embedding
+    
+    async def _lookup_research(self, company_name: str, key: str):
+        """
+        Check the cache for prior research on this company.
+        
+        Returns (cached_research_or_None, name_embedding_or_None).
+        """
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, None
+        return await self._similar_research(company_name)
+    
+    async def _similar_research(self, company_name: str):
+        """
+        Semantic half of _lookup_research: match on the name's embedding.
+        
+        Returns (cached_research_or_None, name_embedding_or_None).
+        """
+        if not AgentConfig.SEMANTIC_CACHE or not HAS_NUMPY:
+            return None, None
+        
+        embedding = await self._embed(company_name.lower().strip())
+        similar_key = self.cache.most_similar(
+            embedding, AgentConfig.SIMILARITY_THRESHOLD, self._research_namespace()
+        )
+        if similar_key:
+            cached = self.cache.get(similar_key)
+        return cached, embedding
+    
+    @staticmethod
+    def _split_verdict(content: str) -> tuple[str, Optional[str]]:
+        """Split fused output into (report, validation verdict or None)."""
+        if AgentConfig.VALIDATION_MARKER not in content:
+            return content, None
+        
+        report, verdict = content.rsplit(AgentConfig.VALIDATION_MARKER, 1)
+        return report.rstrip(), verdict.strip() or None
+    
+    @staticmethod
+    def _system_prompt() -> str:
+        """The research system prompt for the current output mode."""
+        if AgentConfig.STRUCTURED_OUTPUT:
+            return AgentConfig.STRUCTURED_PROMPT
+        return AgentConfig.RESEARCH_PROMPT
+    
+    @staticmethod
+    def _response_format() -> dict:
+        """Extra request arguments for the current output mode."""
+        if not AgentConfig.STRUCTURED_OUTPUT:
+            return {}
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "CompanyReport",
+                    "schema": report_model().model_json_schema(),
+                    "strict": True
+                }
+            }
+        }
+    
+    def _parse_output(self, content: str) -> tuple[str, Optional[str]]:
+        """
+        Turn raw model output into (markdown report, verdict or None).
+        
+        Structured mode parses the JSON and renders it locally; validation
+        is just checking that every field has content.
+        """
+        if not AgentConfig.STRUCTURED_OUTPUT:
+            return self._split_verdict(content)
+        
+        from pydantic import ValidationError
+        
+        try:
+            report = report_model().model_validate_json(content)
+        except ValidationError:
+            return content, "INCOMPLETE: response did not match the CompanyReport schema"
+        
+        empty = _empty_fields(report.model_dump())
+        if empty:
+            return render_report(report), "INCOMPLETE: empty fields: " + ", ".join(empty)
+        return render_report(report), "COMPLETE"
+    
+    @classmethod
+    def _research_namespace(cls) -> str:
+        """Everything but the company that affects the research output."""
+        return cache_key(AgentConfig.MODEL, AgentConfig.TEMPERATURE, cls._system_prompt())
+    
+    @classmethod
+    def _research_key(cls, company_name: str) -> str:
+        """Cache key for researching company_name with the current settings."""
+        return cache_key(
+            AgentConfig.MODEL,
+            AgentConfig.TEMPERATURE,
+            cls._system_prompt(),
+            company_name.lower().strip()
+        )
+    
+    async def _stream_completion(self, messages: list) -> str:
+        """
+        Stream a completion to stdout as tokens arrive; return the full text.
+        
+        The user sees output after the first token instead of waiting for
+        the whole report. The validation trailer is kept off the screen.
+        """
+        marker = AgentConfig.VALIDATION_MARKER
+        buf = []
+        pending = ""  # Text not yet printed (might be the start of the marker)
+        hidden = False
+        
+        # Hold a concurrency slot until the stream is fully read, not just
+        # until the request is sent (_chat leaves streams to its caller).
+        # There is only one stream per run, so backing off inside it is fine
+        async with self._semaphore:
+            response = await self._chat(
+                model=AgentConfig.MODEL,
+                messages=messages,
+                temperature=AgentConfig.TEMPERATURE,
+                stream=True,
+                stream_options={"include_usage": True},
+                extra_body={"prompt_cache_key": AgentConfig.PROMPT_CACHE_KEY}
+            )
+            
+            async for chunk in response:
+                if not chunk.choices:  # The final chunk carries only usage
+                    self._record_usage(chunk.usage)
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                buf.append(delta)
+                if hidden:
+                    continue
+                
+                pending += delta
+                marker_at = pending.find(marker)
+                if marker_at != -1:
+                    sys.stdout.write(pending[:marker_at])
+                    hidden = True
+                elif len(pending) >= len(marker):
+                    safe = len(pending) - len(marker) + 1
+                    sys.stdout.write(pending[:safe])
+                    pending = pending[safe:]
+                sys.stdout.flush()
+        
+        if not hidden:
+            sys.stdout.write(pending)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        
+        return "".join(buf)
+    
+    async def _execute_research(self, company_name: str, stream: bool = False) -> tuple[str, Optional[str]]:
+        """
+        Execute the research using the LLM (or reuse a cached result).
+        
+        Concurrent calls for the same company share one request: the
+        first caller makes it and the rest await its result.
+        
+        With stream=True the report is printed to stdout as well
+        (ignored in structured mode, where the raw output is JSON).
+        
+        Returns:
+            (report, verdict) - verdict is None if the model didn't emit one
+        """
+        key = self._research_key(company_name)
+        stream = stream and not AgentConfig.STRUCTURED_OUTPUT
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            print(f"⏳ Research on '{company_name}' already in flight - sharing it")
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch_research(company_name, key, stream)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        
+        future.set_result(result)
+        return result
+    
+    async def _fetch_research(self, company_name: str, key: str, stream: bool) -> tuple[str, Optional[str]]:
+        """Return cached research, or call the LLM and cache the result."""
+        try:
+            if not self.cache:
+                return self._parse_output(await self._call_research(company_name, stream))
+            
+            cached, embedding = await self._lookup_research(company_name, key)
+            if cached is None:
+                # A per-company file lock makes another process researching
+                # the same company wait, then find our result in the cache
+                lock_path = os.path.join(AgentConfig.CACHE_DIR, "locks", f"{key}.lock")
+                async with process_lock(lock_path):
+                    cached = self.cache.get(key)
+                    if cached is None:
+                        content = await self._call_research(company_name, stream)
+                        self.cache.set(key, content)
+                        if embedding is not None:
+                            self.cache.add_embedding(key, embedding, self._research_namespace())
+                        return self._parse_output(content)
+            
+            print("⚡ Cache hit: reusing previous research")
+            report, verdict = self._parse_output(cached)
+            if stream:
+                print(report)
+            return report, verdict
+        except Exception as e:
+            error = f"Error during research: {str(e)}"
+            if stream:
+                print(error)
+            return error, None
+    
+    async def _call_research(self, company_name: str, stream: bool) -> str:
+        """Make the research API call and return the raw output."""
+        messages = [{"role": "system", "content": self._system_prompt()}]
+        
+        # Related prior research goes after the system prompt, so the
+        # shared prefix stays cacheable
+        references = await self._prior_research(company_name)
+        if references:
+            messages.append({"role": "user", "content": references})
+        messages.append({"role": "user", "content": f"Research this company: {company_name}"})
+        
+        if stream:
+            return await self._stream_completion(messages)
+        
+        response = await self._chat(
+            model=AgentConfig.MODEL,
+            messages=messages,
+            temperature=AgentConfig.TEMPERATURE,
+            extra_body={"prompt_cache_key": AgentConfig.PROMPT_CACHE_KEY},
+            **self._response_format()
+        )
+        return response.choices[0].message.content
+    
+    async def _prior_research(self, company_name: str) -> Optional[str]:
+        """
+        Build a "Reference prior research" block from related saved reports.
+        
+        Returns None if the index is off, empty, or has nothing similar enough.
+        """
+        if not self.report_index or self.report_index.vectors is None:
+            return None
+        
         try:
-            response = self.client.chat.completions.create(
+            matches = self.report_index.search(await self._embed(company_name), exclude=company_name)
+        except Exception:
+            return None  # References are a bonus; never fail research over them
+        
+        excerpts = []
+        for company, report_path in matches:
+            try:
+                with open(report_path, encoding="utf-8") as f:
+                    excerpt = f.read(AgentConfig.REFERENCE_MAX_CHARS)
+            except OSError:
+                continue  # Report was moved or deleted
+            excerpts.append(f"### {company}\n{excerpt}")
+        
+        if not excerpts:
+            return None
+        return (
+            "Reference prior research (related companies; reuse framing, "
+            "not facts):\n\n" + "\n\n".join(excerpts)
+        )
+    
+    async def index_report(self, research: dict):
+        """Add a saved, complete report to the report index."""
+        if not self.report_index or research["status"] != "complete":
+            return
+        
+        report_path = research.get("report_path")
+        if not report_path:
+            return
+        
+        try:
+            vector = await self._embed(research["research"])
+        except Exception as e:
+            print(f"⚠️  Could not index report: {e}")
+            return
+        self.report_index.add(research["company"], report_path, vector)
+    
+    async def _execute_batch(self, company_names: list[str]) -> Optional[list]:
+        """
+        Research several companies in a single LLM call.
+        
+        Returns:
+            One (report, verdict) pair per company, or None if the
+            response doesn't split into exactly that many reports
+        """
+        numbered = "\n".join(f"{i + 1}. {name}" for i, name in enumerate(company_names))
+        prompt = (
+            "Research the following companies. For EACH, emit the full section "
+            "template (including its validation line), separated by the exact line\n"
+            f"{AgentConfig.BATCH_SEPARATOR}\n\n{numbered}"
+        )
+        
+        # One attempt only: a failed batch falls back to per-company calls,
+        # which retry on their own, rather than regenerating every report
+        try:
+            response = await self._chat_once(
                 model=AgentConfig.MODEL,
                 messages=[
                     {"role": "system", "content": AgentConfig.RESEARCH_PROMPT},
-                    {"role": "user", "content": f"Research this company: {company_name}"}
+                    {"role": "user", "content": prompt}
                 ],
-                temperature=AgentConfig.TEMPERATURE
+                temperature=AgentConfig.TEMPERATURE,
+                extra_body={"prompt_cache_key": AgentConfig.PROMPT_CACHE_KEY},
+                timeout=AgentConfig.BATCH_TIMEOUT_PER_COMPANY * len(company_names)
             )
-            return response.choices[0].message.content
         except Exception as e:
-            return f"Error during research: {str(e)}"
+            print(f"⚠️  Batch research failed: {str(e)}")
+            return None
+        
+        content = response.choices[0].message.content
+        parts = [
+            part.strip()
+            for part in content.split(AgentConfig.BATCH_SEPARATOR)
+            if part.strip()
+        ]
+        if len(parts) != len(company_names):
+            return None
+        
+        if self.cache:
+            for name, part in zip(company_names, parts):
+                self.cache.set(self._research_key(name), part)
+        
+        return [self._split_verdict(part) for part in parts]
+    
+    async def _validate_research(self, research: str) -> str:
+        """Validate the research output for completeness (fallback only)."""
+        if AgentConfig.USE_LLM_VALIDATION:
+            return await self._validate_research_llm(research)
+        return self._check_sections(research)
     
-    def _validate_research(self, research: str) -> str:
-        """Validate the research output for completeness."""
+    @staticmethod
+    def _check_sections(research: str) -> str:
+        """
+        Check that every required section is present and not too short.
+        
+        This is a structural property of the text, so plain Python
+        answers it instantly - no LLM judgment required.
+        """
+        bad = []
+        for header in AgentConfig.REQUIRED_SECTIONS:
+            start = research.find(header)
+            if start == -1:
+                bad.append(header.lstrip("# "))
+                continue
+            
+            end = research.find("\n## ", start + len(header))
+            if end == -1:
+                end = len(research)
+            
+            if end - start - len(header) < AgentConfig.MIN_SECTION_CHARS:
+                bad.append(header.lstrip("# "))
+        
+        if bad:
+            return "INCOMPLETE: missing/short sections: " + ", ".join(bad)
+        return "COMPLETE"
+    
+    async def _validate_research_llm(self, research: str) -> str:
+        """Validate the research with a second LLM call."""
+        key = cache_key(AgentConfig.VALIDATION_MODEL, 0, AgentConfig.VALIDATION_PROMPT, research)
+        
         try:
-            response = self.client.chat.completions.create(
-                model=AgentConfig.MODEL,
+            if self.cache:
+                cached = self.cache.get(key, table="validation")
+                if cached is not None:
+                    return cached
+            
+            response = await self._chat(
+                model=AgentConfig.VALIDATION_MODEL,
                 messages=[
                     {"role": "system", "content": AgentConfig.VALIDATION_PROMPT},
                     {"role": "user", "content": research}
                 ],
                 temperature=0  # Use 0 for consistent validation
             )
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            
+            if self.cache:
+                self.cache.set(key, content, table="validation")
+            
+            return content
         except Exception as e:
             return f"INCOMPLETE: Validation error - {str(e)}"
     
-    def save_report(self, filepath: Optional[str] = None) -> str:
-        """Save the current research to a file."""
-        if not self.memory["current_research"]:
+    def save_report(
+        self,
+        filepath: Optional[str] = None,
+        research: Optional[dict] = None,
+        ts: Optional[datetime] = None
+    ) -> str:
+        """
+        Save a research result (default: the current one) to a file.
+        
+        The filename timestamp defaults to the research's own timestamp,
+        so the file always matches research["timestamp"].
+        """
+        research = research or self.memory["current_research"]
+        if not research:
             raise ValueError("No research to save. Run research() first.")
         
+        ts = ts or datetime.fromisoformat(research["timestamp"])
+        
         # Create output directory if needed
         os.makedirs(AgentConfig.OUTPUT_DIR, exist_ok=True)
         
         # Generate filename if not provided
         if not filepath:
-            company_slug = self.memory["current_research"]["company"].lower()
-            company_slug = company_slug.replace(" ", "_").replace(".", "")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            company_slug = research["company"].lower().translate(_SLUG_TABLE)
+            timestamp = ts.strftime("%Y%m%d_%H%M%S")
             filepath = f"{AgentConfig.OUTPUT_DIR}/{company_slug}_research_{timestamp}.md"
         
-        # Format the report
-        research = self.memory["current_research"]
-        report = f"""# Company Research Report: {research['company']}
+        # Format the report (header and footer wrap the research text,
+        # which is written as-is rather than copied into one big string)
+        header = f"""# Company Research Report: {research['company']}
 
 **Generated:** {research['timestamp']}  
 **Status:** {research['status']}
 
 ---
 
-{research['research']}
+"""
+        footer = """
 
 ---
 
 *Generated by AI Agents Bootcamp | [Standout Systems](https://teodoracoach.substack.com/)*
 """
         
-        # Save to file
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(report)
+        # Save atomically: write a temp file in the same directory, then
+        # rename it over the target, so a crash never leaves a torn report
+        tmp = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(filepath) or ".",
+            suffix=".md.tmp",
+            delete=False
+        )
+        try:
+            with tmp:
+                for part in (header, research["research"], footer):
+                    tmp.write(part.encode("utf-8"))
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            # Temp files are created 0600; give the report the mode
+            # a plain open() would (0666 minus the umask)
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+            os.replace(tmp.name, filepath)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        
+        # Point the research and its history entry at the saved report
+        research["report_path"] = filepath
+        for entry in reversed(self.memory["history"]):
+            if (entry["company"], entry["timestamp"]) == (research["company"], research["timestamp"]):
+                entry["report_path"] = filepath
+                break
         
         return filepath
+    
+    def get_history_report(self, index: int) -> str:
+        """Load the saved report for a history entry from disk."""
+        entry = self.memory["history"][index]
+        if not entry["report_path"]:
+            raise ValueError(f"Report for {entry['company']} was never saved.")
+        
+        with open(entry["report_path"], encoding="utf-8") as f:
+            return f.read()
 
 
 # ==========================================================
 # DISPLAY UTILITIES
 # ==========================================================
 
-def display_results(research: dict):
-    """Pretty print the research results to console."""
-    print("\n" + "=" * 60)
-    print(f"📋 RESEARCH REPORT: {research['company'].upper()}")
-    print("=" * 60)
-    print(f"Status: {research['status']}")
-    print("-" * 60)
-    print(research['research'])
-    print("=" * 60)
+def display_results(research: dict, show_body: bool = True):
+    """Pretty print the research results to console (in a single write)."""
+    lines = [
+        "",
+        "=" * 60,
+        f"📋 RESEARCH REPORT: {research['company'].upper()}",
+        "=" * 60,
+        f"Status: {research['status']}"
+    ]
+    if show_body:  # Skipped when the report was already streamed
+        lines += ["-" * 60, research['research']]
+    lines += ["=" * 60, ""]
+    
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def display_welcome():
     """Display welcome message."""
-    print("""
+    sys.stdout.write("""
 ╔═══════════════════════════════════════════════════════════╗
 ║                                                           ║
 ║   🤖 AI AGENTS BOOTCAMP - Day 1                          ║
@@ -282,14 +1377,16 @@ def display_welcome():
 ║   • Feedback  → Validates completeness                    ║
 ║                                                           ║
 ╚═══════════════════════════════════════════════════════════╝
-    """)
+
+""")
+    sys.stdout.flush()
 
 
 # ==========================================================
 # MAIN EXECUTION
 # ==========================================================
 
-def main():
+async def main():
     """Main function to run the research agent."""
     display_welcome()
     
@@ -299,41 +1396,65 @@ def main():
         print("   Please copy .env.example to .env and add your API key.")
         sys.exit(1)
     
-    # Get company name from user
-    print("Enter a company name to research.")
-    print("(Press Enter for default: 'Stripe')\n")
-    company = input("🏢 Company: ").strip()
-    
-    if not company:
-        company = "Stripe"
-        print(f"   Using default: {company}")
-    
-    # Initialize and run the agent
     try:
+        # Initialize the agent once; its memory and caches carry across companies
         agent = CompanyResearchAgent()
-        results = agent.research(company)
         
-        # Display results
-        display_results(results)
-        
-        # Save to file
-        filepath = agent.save_report()
-        print(f"\n💾 Report saved to: {filepath}")
+        while True:
+            # Get company name(s) from user
+            print("Enter a company name to research.")
+            print("(Separate several with commas; press Enter for default: 'Stripe')\n")
+            companies = [name.strip() for name in input("🏢 Company: ").split(",") if name.strip()]
+            
+            if not companies:
+                companies = ["Stripe"]
+                print(f"   Using default: {companies[0]}")
+            
+            # Run the agent
+            streamed = len(companies) == 1 and not AgentConfig.STRUCTURED_OUTPUT
+            if len(companies) == 1:
+                all_results = [await agent.research(companies[0], stream=streamed)]
+            else:
+                print(f"\n📦 Researching {len(companies)} companies in batches...")
+                all_results = await agent.research_batch(companies)
+            
+            for results in all_results:
+                # Display results
+                display_results(results, show_body=not streamed)
+                
+                # Save to file
+                filepath = agent.save_report(research=results)
+                print(f"\n💾 Report saved to: {filepath}")
+                await agent.index_report(results)
+            
+            if agent.usage["cached_tokens"]:  # Zero unless the prefix is cacheable
+                print(f"📈 Prompt cache: {agent.prompt_cache_hit_rate:.0%} of "
+                      f"{agent.usage['prompt_tokens']} input tokens served from cache")
+            
+            # Offer to research another company
+            print("\n" + "-" * 60)
+            another = input("Research another company? (y/n): ").strip().lower()
+            if another != 'y':
+                break
+            print()
         
-        # Offer to research another company
-        print("\n" + "-" * 60)
-        another = input("Research another company? (y/n): ").strip().lower()
-        if another == 'y':
-            main()
-        else:
-            print("\n👋 Thanks for using AI Agents Bootcamp!")
-            print("   Next: Day 2 - Multi-Agent Systems with CrewAI")
-            print("   Subscribe: https://teodoracoach.substack.com/\n")
+        print("\n👋 Thanks for using AI Agents Bootcamp!")
+        print("   Next: Day 2 - Multi-Agent Systems with CrewAI")
+        print("   Subscribe: https://teodoracoach.substack.com/\n")
     
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
         sys.exit(1)
 
 
+async def _run():
+    """Run main() and close pooled connections on the way out."""
+    try:
+        await main()
+    finally:
+        if _SHARED_HTTPX is not None:
+            await _SHARED_HTTPX.aclose()
+
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(_run())
@@ -22,23 +22,42 @@ Series: https://teodoracoach.substack.com
 
 import os
 import sys
+import json
+import time
+import uuid
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Optional
 
 # ============================================================================
 # IMPORTS & SETUP
 # ============================================================================
 
 try:
-    from crewai import Agent, Crew, Task, Process
-    from crewai_tools import SerperDevTool
-    from langchain_openai import ChatOpenAI
     from dotenv import load_dotenv
 except ImportError as e:
     print("❌ Missing dependencies. Install with:")
     print("   pip install crewai crewai-tools langchain-openai python-dotenv")
     sys.exit(1)
 
+
+def check_dependencies():
+    """Make sure the agent frameworks (imported where they're used) are installed."""
+    try:
+        import crewai  # noqa: F401
+        import crewai_tools  # noqa: F401
+        import langchain_openai  # noqa: F401
+    except ImportError as e:
+        print("❌ Missing dependencies. Install with:")
+        print("   pip install crewai crewai-tools langchain-openai python-dotenv")
+        sys.exit(1)
+
+
 # Load environment variables
 load_dotenv()
 
@@ -53,6 +72,12 @@ class InterviewConfig:
     MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
     TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
     
+    # Per-agent models: research needs the strongest model, while the
+    # analyzer and coach work from its findings and run fine on a smaller one
+    RESEARCH_MODEL = os.getenv("OPENAI_RESEARCH_MODEL", MODEL)
+    ANALYZER_MODEL = os.getenv("OPENAI_ANALYZER_MODEL", "gpt-4o-mini")
+    COACH_MODEL = os.getenv("OPENAI_COACH_MODEL", "gpt-4o-mini")
+    
     # Interview Details (Customize these!)
     COMPANY = "Anthropic"
     POSITION = "Senior Machine Learning Engineer"
@@ -74,10 +99,21 @@ class InterviewConfig:
     - Strong Python, PyTorch, distributed training
     """
     
+    # Batch API: ~50% cheaper, but each request waits minutes for its batch.
+    # Only worth it when nobody is waiting on the answer (e.g. prepping
+    # several candidates overnight). Requests are pooled before submitting:
+    # up to RoutingPolicy.solo_window_ms (2 s) with one crew, or
+    # batch_window_ms (30 s) when several crews share the dispatcher.
+    USE_BATCH_API = os.getenv("OPENAI_BATCH_API", "false").lower() == "true"
+    
     # Output directory
     OUTPUT_DIR = Path("outputs")
 
 
+# Filename-safe company slugs in one pass
+_SLUG_TABLE = str.maketrans({" ": "_", ".": "", "/": "_", ",": "", "'": ""})
+
+
 def validate_api_keys():
     """Check that required API keys are set."""
     openai_key = os.getenv("OPENAI_API_KEY")
@@ -110,6 +146,8 @@ def create_research_agent(llm, tools):
     - Tools: Web search for real-time information
     - Memory: Findings passed to next agents via task context
     """
+    from crewai import Agent
+    
     return Agent(
         role="Senior Company Research Analyst",
         goal=f"Conduct comprehensive research on {InterviewConfig.COMPANY} "
@@ -137,6 +175,8 @@ def create_analyzer_agent(llm):
     - Tools: None (works from research context)
     - Memory: Receives research, outputs to coach
     """
+    from crewai import Agent
+    
     return Agent(
         role="Career Strategy Consultant",
         goal="Analyze candidate-company fit and develop winning positioning strategy",
@@ -161,6 +201,8 @@ def create_coach_agent(llm):
     - Tools: None (works from research + analysis)
     - Memory: Synthesizes all prior work into prep guide
     """
+    from crewai import Agent
+    
     return Agent(
         role="Technical Interview Coach",
         goal=f"Generate highly targeted interview questions and prep strategy for "
@@ -180,54 +222,86 @@ def create_coach_agent(llm):
 # TASK DEFINITIONS
 # ============================================================================
 
-def create_research_task(agent):
-    """Deep company research task with web search."""
-    return Task(
-        description=f"""
-        Research {InterviewConfig.COMPANY} comprehensively for an upcoming interview.
-        
-        Cover these areas IN DEPTH:
-        
-        1. **Recent News** (last 6 months)
+def create_research_tasks(llm, tools):
+    """
+    Company research, split into 5 independent web-search tasks.
+    
+    The topics don't depend on each other, so each task runs with
+    async_execution=True: CrewAI starts them concurrently and the
+    analysis task (which lists them all as context) waits for all five.
+    Research time becomes the slowest topic, not the sum of all five.
+    
+    Each task gets its own research agent: CrewAI refuses to run one
+    agent's executor for two tasks at once.
+    """
+    from crewai import Task
+    
+    topics = [
+        (
+            "Recent News (last 6 months)",
+            """
            - Major announcements, funding rounds, product launches
            - Any controversies, challenges, or pivots
-           - Key wins, milestones, or recognition
-        
-        2. **Technical Focus**
+           - Key wins, milestones, or recognition"""
+        ),
+        (
+            "Technical Focus",
+            """
            - What technical problems are they solving?
            - Their tech stack and approach
-           - Recent engineering blog posts, papers, or open source
-        
-        3. **Team & Culture**
+           - Recent engineering blog posts, papers, or open source"""
+        ),
+        (
+            "Team & Culture",
+            """
            - Leadership team backgrounds
            - Company values (not PR speak—what they actually DO)
-           - Glassdoor/Blind insights on real culture
-        
-        4. **The Specific Role: {InterviewConfig.POSITION}**
+           - Glassdoor/Blind insights on real culture"""
+        ),
+        (
+            f"The Specific Role: {InterviewConfig.POSITION}",
+            """
            - What team would this likely be on?
            - Current projects or initiatives
-           - What would success look like in 6 months?
-        
-        5. **Interviewer Research: {InterviewConfig.INTERVIEWER}**
+           - What would success look like in 6 months?"""
+        ),
+        (
+            f"Interviewer Research: {InterviewConfig.INTERVIEWER}",
+            """
            - Their background and expertise
            - Published work, talks, or public opinions
-           - What do they care about professionally?
+           - What do they care about professionally?"""
+        ),
+    ]
+    
+    return [
+        Task(
+            description=f"""
+        Research {InterviewConfig.COMPANY} for an upcoming interview.
+        
+        Cover this area IN DEPTH:
+        
+        **{topic}**{points}
         
         Be specific and cite sources. Skip generic information.
         """,
-        expected_output="""
-        A detailed research report with:
-        - Executive summary (3-4 key takeaways)
-        - Detailed findings organized by category
+            expected_output=f"""
+        Focused findings on "{topic}" with:
+        - 2-3 key takeaways
         - Non-obvious insights that matter for interview
         - Sources cited for key facts
         """,
-        agent=agent
-    )
+            agent=create_research_agent(llm, tools),
+            async_execution=True
+        )
+        for topic, points in topics
+    ]
 
 
-def create_analysis_task(agent, research_task):
+def create_analysis_task(agent, research_tasks):
     """Strategic fit analysis task."""
+    from crewai import Task
+    
     return Task(
         description=f"""
         Based on the research findings, analyze candidate-company fit and 
@@ -269,12 +343,14 @@ def create_analysis_task(agent, research_task):
         - Risk mitigation strategies
         """,
         agent=agent,
-        context=[research_task]
+        context=research_tasks
     )
 
 
-def create_coaching_task(agent, research_task, analysis_task):
+def create_coaching_task(agent, research_tasks, analysis_task):
     """Interview prep questions and strategy task."""
+    from crewai import Task
+    
     return Task(
         description=f"""
         Based on ALL previous analysis, create a comprehensive interview 
@@ -316,10 +392,195 @@ def create_coaching_task(agent, research_task, analysis_task):
         - Day-of strategy and talking points
         """,
         agent=agent,
-        context=[research_task, analysis_task]
+        context=[*research_tasks, analysis_task]
     )
 
 
+# ============================================================================
+# BATCH API ROUTING (Cost Optimization)
+# ============================================================================
+
+@dataclass
+class RoutingPolicy:
+    """When to call the API directly vs. pool requests into a batch job."""
+    
+    # Callers whose latency budget is at or below this go straight to the API
+    sync_max_latency_ms: int = 60_000
+    
+    # Submit a batch this long after its first request was queued...
+    batch_window_ms: int = 30_000
+    
+    # ...or as soon as this many requests are waiting
+    batch_min_size: int = 10
+    
+    # With a single producer (one crew, the usual case) nobody else will
+    # fill the batch, so don't hold its requests for the full window
+    solo_window_ms: int = 2_000
+
+
+class FleetDispatcher:
+    """
+    Pools chat completion requests into OpenAI Batch API jobs.
+    
+    Any number of crews (running in threads) can share one dispatcher.
+    Each request waits on a Future; a background thread submits the queue
+    as one batch when it's big enough or old enough, polls until the
+    batch finishes, then resolves every Future with its response.
+    """
+    
+    def __init__(self, policy: Optional[RoutingPolicy] = None, poll_interval_s: float = 30.0):
+        from openai import OpenAI
+        
+        self.client = OpenAI()
+        self.policy = policy or RoutingPolicy()
+        self.poll_interval_s = poll_interval_s
+        
+        self._queue = []  # (custom_id, request body, Future)
+        self._first_queued_at = None
+        self._producers = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+    
+    def register_producer(self):
+        """Announce one more crew sharing this dispatcher."""
+        with self._lock:
+            self._producers += 1
+    
+    def submit(self, body: dict) -> Future:
+        """Queue one /v1/chat/completions request body; returns a Future."""
+        future = Future()
+        with self._lock:
+            if not self._queue:
+                self._first_queued_at = time.monotonic()
+            self._queue.append((uuid.uuid4().hex, body, future))
+            if len(self._queue) >= self.policy.batch_min_size:
+                self._wakeup.set()
+        return future
+    
+    def _flush_loop(self):
+        """Submit the queue whenever the size or time threshold is hit."""
+        while True:
+            self._wakeup.wait(timeout=0.5)
+            self._wakeup.clear()
+            
+            with self._lock:
+                if not self._queue:
+                    continue
+                age_ms = (time.monotonic() - self._first_queued_at) * 1000
+                window_ms = (
+                    self.policy.batch_window_ms if self._producers > 1
+                    else self.policy.solo_window_ms
+                )
+                if len(self._queue) < self.policy.batch_min_size and age_ms < window_ms:
+                    continue
+                pending, self._queue = self._queue, []
+            
+            threading.Thread(target=self._run_batch, args=(pending,), daemon=True).start()
+    
+    def _run_batch(self, pending: list):
+        """Upload, submit and poll one batch, then resolve its Futures."""
+        try:
+            lines = "\n".join(
+                json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                })
+                for custom_id, body, _ in pending
+            )
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", lines.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            print(f"📦 Submitted batch {batch.id} ({len(pending)} requests)")
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(self.poll_interval_s)
+                batch = self.client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed":
+                raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+            
+            results = {}
+            if batch.output_file_id:
+                output = self.client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    record = json.loads(line)
+                    results[record["custom_id"]] = record
+            
+            for custom_id, _, future in pending:
+                record = results.get(custom_id)
+                response = (record or {}).get("response") or {}
+                if response.get("status_code") == 200:
+                    future.set_result(response["body"])
+                else:
+                    error = (record or {}).get("error") or "no result returned"
+                    future.set_exception(RuntimeError(f"Batch request failed: {error}"))
+        
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+
+
+@functools.lru_cache(maxsize=None)
+def batch_llm_class():
+    """
+    Define BatchLLM on first use.
+    
+    It subclasses crewai's BaseLLM, so building it at import time would
+    pull in crewai before it's needed.
+    """
+    from crewai import BaseLLM
+    
+    class BatchLLM(BaseLLM):
+        """
+        CrewAI custom LLM that sends its calls through a FleetDispatcher.
+        
+        CrewAI rebuilds any LangChain model it's given as its own LLM, so
+        overriding ChatOpenAI would never be called. A BaseLLM subclass
+        is used as-is (crewai >= 1.13, see requirements): each call
+        blocks until its batch job returns.
+        """
+        
+        dispatcher: Any = None
+        
+        # How long this caller can wait for an answer
+        latency_budget_ms: int = 24 * 60 * 60 * 1000
+        
+        def _use_batch(self) -> bool:
+            return self.latency_budget_ms > self.dispatcher.policy.sync_max_latency_ms
+        
+        def call(self, messages, tools=None, callbacks=None, available_functions=None,
+                 from_task=None, from_agent=None, response_model=None):
+            body = {"model": self.model, "messages": self._format_messages(messages)}
+            if self.temperature is not None:
+                body["temperature"] = self.temperature
+            if self.stop_sequences:
+                body["stop"] = self.stop_sequences
+            
+            if self._use_batch():
+                response = self.dispatcher.submit(body).result()
+            else:
+                response = self.dispatcher.client.chat.completions.create(**body).model_dump()
+            
+            self._track_token_usage_internal(response.get("usage") or {})
+            return response["choices"][0]["message"]["content"] or ""
+        
+        async def acall(self, messages, tools=None, callbacks=None, available_functions=None,
+                        from_task=None, from_agent=None, response_model=None):
+            return await asyncio.to_thread(self.call, messages, tools, callbacks, available_functions)
+    
+    return BatchLLM
+
+
 # ============================================================================
 # CREW ORCHESTRATION
 # ============================================================================
@@ -336,13 +597,25 @@ class InterviewPrepCrew:
     - Feedback: Sequential validation through pipeline
     """
     
-    def __init__(self, use_web_search=True):
-        """Initialize the crew with agents and tasks."""
-        # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=InterviewConfig.MODEL,
-            temperature=InterviewConfig.TEMPERATURE
-        )
+    def __init__(self, use_web_search=True, dispatcher=None):
+        """
+        Initialize the crew with agents and tasks.
+        
+        Pass a FleetDispatcher to route LLM calls through the Batch API
+        (share one dispatcher between crews to fill batches faster).
+        """
+        check_dependencies()
+        from crewai import Crew, Process
+        from crewai_tools import SerperDevTool
+        
+        self.dispatcher = dispatcher
+        if dispatcher:
+            dispatcher.register_producer()
+        
+        # Initialize LLMs (one per agent, so each can use a different model)
+        self.llm = self._make_llm(InterviewConfig.RESEARCH_MODEL)
+        self.analyzer_llm = self._make_llm(InterviewConfig.ANALYZER_MODEL)
+        self.coach_llm = self._make_llm(InterviewConfig.COACH_MODEL)
         
         # Initialize tools
         self.tools = []
@@ -353,31 +626,30 @@ class InterviewPrepCrew:
             print("⚠️  Running without web search (limited research)")
         
         # Create agents
-        self.research_agent = create_research_agent(self.llm, self.tools)
-        self.analyzer_agent = create_analyzer_agent(self.llm)
-        self.coach_agent = create_coach_agent(self.llm)
+        self.analyzer_agent = create_analyzer_agent(self.analyzer_llm)
+        self.coach_agent = create_coach_agent(self.coach_llm)
         
-        # Create tasks
-        self.research_task = create_research_task(self.research_agent)
+        # Create tasks (5 research topics run in parallel, one agent each)
+        self.research_tasks = create_research_tasks(self.llm, self.tools)
         self.analysis_task = create_analysis_task(
             self.analyzer_agent, 
-            self.research_task
+            self.research_tasks
         )
         self.coaching_task = create_coaching_task(
             self.coach_agent,
-            self.research_task,
+            self.research_tasks,
             self.analysis_task
         )
         
         # Assemble crew
         self.crew = Crew(
             agents=[
-                self.research_agent,
+                *(task.agent for task in self.research_tasks),
                 self.analyzer_agent,
                 self.coach_agent
             ],
             tasks=[
-                self.research_task,
+                *self.research_tasks,
                 self.analysis_task,
                 self.coaching_task
             ],
@@ -385,6 +657,21 @@ class InterviewPrepCrew:
             verbose=True
         )
     
+    def _make_llm(self, model):
+        """Create a chat model with the shared temperature setting."""
+        from langchain_openai import ChatOpenAI
+        
+        if self.dispatcher:
+            return batch_llm_class()(
+                model=model,
+                temperature=InterviewConfig.TEMPERATURE,
+                dispatcher=self.dispatcher
+            )
+        return ChatOpenAI(
+            model=model,
+            temperature=InterviewConfig.TEMPERATURE
+        )
+    
     def run(self):
         """Execute the interview prep workflow."""
         print("\n" + "=" * 60)
@@ -407,7 +694,7 @@ class InterviewPrepCrew:
         
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        company_slug = InterviewConfig.COMPANY.lower().replace(" ", "_")
+        company_slug = InterviewConfig.COMPANY.lower().translate(_SLUG_TABLE)
         filename = f"{company_slug}_interview_prep_{timestamp}.md"
         filepath = InterviewConfig.OUTPUT_DIR / filename
         
@@ -461,7 +748,12 @@ def main():
         return
     
     # Create and run crew
-    crew = InterviewPrepCrew(use_web_search=has_serper)
+    dispatcher = None
+    if InterviewConfig.USE_BATCH_API:
+        print("📦 Batch API mode: ~50% cheaper, but expect a much longer run\n")
+        dispatcher = FleetDispatcher()
+    
+    crew = InterviewPrepCrew(use_web_search=has_serper, dispatcher=dispatcher)
     result = crew.run()
     
     # Display results
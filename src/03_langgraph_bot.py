@@ -19,30 +19,58 @@ Series: https://teodoracoach.substack.com
 """
 
 import os
+import re
 import sys
 import json
+import time
+import asyncio
+import hashlib
+import threading
+import functools
+import importlib.util
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict, List, Literal, Annotated
+from typing import TypedDict, List, Literal, Annotated, Optional
 import operator
+from collections import Counter
 
 # ============================================================================
 # IMPORTS & SETUP
 # ============================================================================
 
 try:
-    from langgraph.graph import StateGraph, END
-    from langchain_openai import ChatOpenAI
-    from langchain_core.messages import HumanMessage, SystemMessage
     from dotenv import load_dotenv
 except ImportError as e:
     print("❌ Missing dependencies. Install with:")
     print("   pip install langgraph langchain-openai langchain-core python-dotenv")
     sys.exit(1)
 
+
+def check_dependencies():
+    """Make sure LangGraph and LangChain (imported where they're used) are installed."""
+    missing = [
+        name for name in ("langgraph", "langchain_openai", "langchain_core")
+        if importlib.util.find_spec(name) is None
+    ]
+    if missing:
+        print("❌ Missing dependencies. Install with:")
+        print("   pip install langgraph langchain-openai langchain-core python-dotenv")
+        sys.exit(1)
+
+
+try:
+    import orjson  # Optional: faster checkpoint (de)serialization
+except ImportError:
+    orjson = None
+
+from utils import SemanticCache
+
 # Load environment variables
 load_dotenv()
 
+# numpy is optional: used by the analyzer cache and the session stats
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -59,9 +87,24 @@ class BotConfig:
     POSITION = "Senior Machine Learning Engineer"
     DIFFICULTY = "medium"  # easy, medium, hard
     
+    # interactive: feedback after every answer
+    # bulk: answer every question first, then all answers are analyzed at once
+    MODE = os.getenv("INTERVIEW_MODE", "interactive")
+    BATCH_CONCURRENCY = 5  # max parallel analyzer calls in bulk mode
+    
+    # Reuse generated questions for the same model/company/position/difficulty
+    # (always on at temperature 0, where regenerating would give the same set)
+    DETERMINISTIC = os.getenv("DETERMINISTIC_QUESTIONS", "false").lower() == "true"
+    
     # Output
     OUTPUT_DIR = Path("outputs")
     CHECKPOINT_FILE = "interview_checkpoint.json"
+    
+    # Analyzer cache: reuse feedback for near-identical question+answer pairs
+    # (needs numpy; similarity is measured on embeddings)
+    ANALYZE_CACHE = os.getenv("ANALYZE_CACHE", "false").lower() == "true"
+    ANALYZE_CACHE_FILE = "analyze_cache.jsonl"
+    EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
 
 
 def validate_api_key():
@@ -77,6 +120,20 @@ def validate_api_key():
 # STATE DEFINITION
 # ============================================================================
 
+def merge_exchanges(old: List[dict], new: List[dict]) -> List[dict]:
+    """
+    Reducer for exchanges: append new ones, update existing ones.
+    
+    Exchanges are matched by question_num, so a node can return just
+    {"question_num": 2, "score": 7, ...} to fill in question 2 -
+    no node has to mutate the list it was given.
+    """
+    merged = {ex["question_num"]: ex for ex in old}
+    for ex in new:
+        merged[ex["question_num"]] = {**merged.get(ex["question_num"], {}), **ex}
+    return list(merged.values())
+
+
 class InterviewState(TypedDict):
     """
     The shared state that flows through all nodes.
@@ -97,12 +154,12 @@ class InterviewState(TypedDict):
     questions: List[str]
     current_index: int
     
-    # Conversation tracking (Annotated with operator.add = auto-append)
-    exchanges: Annotated[List[dict], operator.add]
+    # Conversation tracking (merge_exchanges = append or update by question_num)
+    exchanges: Annotated[List[dict], merge_exchanges]
     
-    # Performance metrics
-    scores: List[int]
-    weak_areas: List[str]
+    # Performance metrics (also auto-append: nodes return only new entries)
+    scores: Annotated[List[int], operator.add]
+    weak_areas: Annotated[List[str], operator.add]
     
     # Flow control
     user_wants_continue: bool
@@ -113,12 +170,61 @@ class InterviewState(TypedDict):
 # LLM INITIALIZATION
 # ============================================================================
 
-def get_llm():
-    """Initialize the language model."""
-    return ChatOpenAI(
-        model=BotConfig.MODEL,
-        temperature=BotConfig.TEMPERATURE
+# Every model get_llm has built, so close_llms can shut their clients
+_llms: list = []
+
+
+@functools.lru_cache(maxsize=4)
+def get_llm(model: str = None, temperature: float = None):
+    """
+    Initialize the language model (once per model/temperature).
+    
+    Every node shares the same client and its HTTP connection pool,
+    so the TLS connection stays warm across the interview loop.
+    """
+    import httpx
+    from langchain_openai import ChatOpenAI
+    
+    llm = ChatOpenAI(
+        model=model or BotConfig.MODEL,
+        temperature=BotConfig.TEMPERATURE if temperature is None else temperature,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=8)
+        ),
+        http_async_client=httpx.AsyncClient(
+            # Idle connections outlive a typical answer (see _keep_connection_warm)
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30.0)
+        )
     )
+    _llms.append(llm)
+    return llm
+
+
+async def close_llms():
+    """Close the HTTP clients of every cached model and empty the cache."""
+    while _llms:
+        llm = _llms.pop()
+        if llm.http_async_client is not None:
+            await llm.http_async_client.aclose()
+        if llm.http_client is not None:
+            llm.http_client.close()
+    get_llm.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def get_analyze_cache():
+    """Load the analyzer's semantic cache, or None if it's disabled."""
+    if not (BotConfig.ANALYZE_CACHE and HAS_NUMPY):
+        return None
+    return SemanticCache(str(BotConfig.OUTPUT_DIR / BotConfig.ANALYZE_CACHE_FILE))
+
+
+@functools.lru_cache(maxsize=1)
+def get_embeddings():
+    """Initialize the embedding model used for cache lookups."""
+    from langchain_openai import OpenAIEmbeddings
+    
+    return OpenAIEmbeddings(model=BotConfig.EMBEDDING_MODEL)
 
 
 # ============================================================================
@@ -126,7 +232,62 @@ def get_llm():
 # Each node: state in → transformed state out
 # ============================================================================
 
-def generate_questions(state: InterviewState) -> dict:
+# A numbered ("1." / "1)") or bulleted ("-" / "*") line; captures the text
+_Q_RE = re.compile(r'^\s*(?:\d+[.)]|[-*])\s*(.+?)\s*$', re.M)
+
+# Analyzer response fields ("SCORE: 7" or "SCORE: 7/10", "WEAK_AREA: ...")
+_SCORE_RE = re.compile(r'^\s*SCORE:\s*(\d+)', re.M)
+_WEAK_RE = re.compile(r'^\s*WEAK_AREA:\s*(.+?)\s*$', re.M)
+
+# Score bars for 0-10, e.g. _BARS[7] == "███████░░░"
+_BARS = tuple("█" * s + "░" * (10 - s) for s in range(11))
+
+# The analyzer's system prompt, hoisted out of analyze_answer so the node
+# body stays readable. At ~250 tokens it is below OpenAI's 1024-token
+# minimum, so this does not make it eligible for prompt caching.
+_ANALYZER_PROMPT = """You are an expert interview coach. 
+        Analyze this interview answer and provide structured feedback.
+        
+        Score the answer from 1-10 based on:
+        - Clarity and structure
+        - Relevance to the question
+        - Specific examples provided
+        - Technical accuracy (if applicable)
+        - Communication quality
+        
+        Format your response EXACTLY like this:
+        SCORE: [number 1-10]
+        
+        STRENGTHS:
+        • [specific strength 1]
+        • [specific strength 2]
+        
+        IMPROVEMENTS:
+        • [specific, actionable improvement 1]
+        • [specific, actionable improvement 2]
+        
+        PRO TIP: [one insider tip for this type of question]
+        
+        WEAK_AREA: [if score < 7, name ONE skill to work on, e.g., "using specific examples", "structuring responses with STAR", "technical depth". If score >= 7, write "none"]
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def _analyzer_sys():
+    """The analyzer's SystemMessage, built once and reused for every call."""
+    from langchain_core.messages import SystemMessage
+    
+    return SystemMessage(content=_ANALYZER_PROMPT)
+
+
+@functools.lru_cache(maxsize=1)
+def _analyze_cache_namespace() -> str:
+    """Scope cached feedback to the model, temperature and prompt behind it."""
+    raw = f"{BotConfig.MODEL}|{BotConfig.TEMPERATURE}|{_ANALYZER_PROMPT}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def generate_questions(state: InterviewState) -> dict:
     """
     NODE 1: Generate interview questions
     
@@ -136,40 +297,25 @@ def generate_questions(state: InterviewState) -> dict:
     - Tools: None (pure generation)
     - Memory: Writes questions to state
     """
-    llm = get_llm()
+    # Resumed session: keep the questions (and progress) from the checkpoint
+    if state.get("questions"):
+        print(f"\n✅ Resuming with {len(state['questions'])} saved questions")
+        return {}
     
     print("\n" + "=" * 60)
     print("🎯 GENERATING QUESTIONS")
     print("=" * 60)
     print(f"\nPreparing {state['difficulty']} questions for {state['position']}...")
     
-    response = llm.invoke([
-        SystemMessage(content=f"""You are a senior interviewer at {state['company']}.
-        Generate exactly 5 interview questions for a {state['position']} role.
-        
-        Difficulty level: {state['difficulty']}
-        
-        Create a balanced mix:
-        - 2 technical questions (appropriate to the role)
-        - 2 behavioral questions (STAR format appropriate)  
-        - 1 role-specific scenario question
-        
-        Return ONLY the questions, numbered 1-5.
-        No explanations, no headers, just the questions."""),
-        HumanMessage(content="Generate the 5 interview questions now.")
-    ])
-    
-    # Parse questions from response
-    lines = response.content.strip().split('\n')
-    questions = []
-    for line in lines:
-        line = line.strip()
-        if line and (line[0].isdigit() or line.startswith('-')):
-            # Remove number prefix if present
-            if line[0].isdigit():
-                line = line.split('.', 1)[-1].strip()
-                line = line.split(')', 1)[-1].strip()
-            questions.append(line)
+    cache_path = _question_cache_path(state)
+    if cache_path and cache_path.exists():
+        questions = json.loads(cache_path.read_text(encoding="utf-8"))
+        print("♻️  Using cached questions")
+    else:
+        questions = await _request_questions(state)
+        if questions and cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(questions), encoding="utf-8")
     
     # Ensure we have questions
     if not questions:
@@ -188,14 +334,51 @@ def generate_questions(state: InterviewState) -> dict:
     
     return {
         "questions": questions[:5],  # Limit to 5
-        "current_index": 0,
-        "exchanges": [],
-        "scores": [],
-        "weak_areas": []
+        "current_index": 0
     }
 
 
-def ask_question(state: InterviewState) -> dict:
+def _question_cache_path(state: InterviewState):
+    """Cache file for this question set, or None if caching is off."""
+    if not (BotConfig.DETERMINISTIC or BotConfig.TEMPERATURE == 0):
+        return None
+    
+    key = hashlib.sha256(json.dumps({
+        "m": BotConfig.MODEL,
+        "c": state["company"],
+        "p": state["position"],
+        "d": state["difficulty"]
+    }, sort_keys=True).encode()).hexdigest()
+    return BotConfig.OUTPUT_DIR / "qcache" / f"{key}.json"
+
+
+async def _request_questions(state: InterviewState) -> List[str]:
+    """Ask the LLM for questions and parse them (may return [])."""
+    from langchain_core.messages import HumanMessage, SystemMessage
+    
+    llm = get_llm()
+    
+    response = await llm.ainvoke([
+        SystemMessage(content=f"""You are a senior interviewer at {state['company']}.
+        Generate exactly 5 interview questions for a {state['position']} role.
+        
+        Difficulty level: {state['difficulty']}
+        
+        Create a balanced mix:
+        - 2 technical questions (appropriate to the role)
+        - 2 behavioral questions (STAR format appropriate)  
+        - 1 role-specific scenario question
+        
+        Return ONLY the questions, numbered 1-5.
+        No explanations, no headers, just the questions."""),
+        HumanMessage(content="Generate the 5 interview questions now.")
+    ])
+    
+    # Parse questions from response
+    return _Q_RE.findall(response.content)[:5]
+
+
+async def ask_question(state: InterviewState) -> dict:
     """
     NODE 2: Present question and collect answer
     
@@ -208,6 +391,49 @@ def ask_question(state: InterviewState) -> dict:
     question = state["questions"][idx]
     total = len(state["questions"])
     
+    # Resumed right after answering: the answer is in the checkpoint
+    # but wasn't analyzed yet, so go straight to analysis
+    exchanges = state.get("exchanges", [])
+    if exchanges and exchanges[-1]["question_num"] == idx + 1 and "score" not in exchanges[-1]:
+        print(f"\n✅ Resuming with your saved answer to question {idx + 1}")
+        return {}
+    
+    _print_question(idx, question, total)
+    
+    # Keep the API connection warm while the user types, so the
+    # analyzer's request doesn't pay for a fresh TCP/TLS handshake
+    warmup = asyncio.create_task(_keep_connection_warm())
+    try:
+        answer = await _read_answer()
+    finally:
+        warmup.cancel()
+    
+    return {"exchanges": [_make_exchange(idx, question, answer)]}
+
+
+async def _keep_connection_warm(interval: float = 20.0):
+    """
+    Ping the API base URL through the shared connection pool until cancelled.
+    
+    A HEAD request is enough to open (then keep alive) a pooled connection;
+    the response itself doesn't matter, and errors are ignored.
+    """
+    llm = get_llm()
+    client = getattr(llm, "http_async_client", None)
+    if client is None:
+        return
+    base_url = llm.openai_api_base or "https://api.openai.com/v1"
+    
+    while True:
+        try:
+            await client.head(base_url, timeout=1.0)
+        except Exception:
+            pass  # Just a warmup - the real request will surface real errors
+        await asyncio.sleep(interval)
+
+
+def _print_question(idx: int, question: str, total: int):
+    """Print the question header and answer instructions."""
     print("\n" + "=" * 60)
     print(f"📝 QUESTION {idx + 1} of {total}")
     print("=" * 60)
@@ -215,38 +441,88 @@ def ask_question(state: InterviewState) -> dict:
     print("-" * 60)
     print("Type your answer below.")
     print("(Press Enter twice when finished)\n")
+
+
+async def _ainput(prompt: str = "") -> Optional[str]:
+    """
+    Read one line from stdin without blocking the event loop.
+    
+    Returns the line without its newline, or None at end of input.
+    """
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    
+    # A daemon thread rather than asyncio.to_thread: a readline can't be
+    # cancelled, and asyncio.run would wait for it on Ctrl+C
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
     
-    # Collect multi-line input
+    def read():
+        line = sys.stdin.readline()
+        try:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(line))
+        except RuntimeError:
+            pass  # Loop already closed (session was interrupted)
+    
+    threading.Thread(target=read, daemon=True).start()
+    line = await future
+    return line.rstrip("\n") if line else None
+
+
+async def _read_answer() -> str:
+    """Collect a multi-line answer from stdin (ends on an empty line)."""
     lines = []
     empty_count = 0
     while empty_count < 1:
-        try:
-            line = input()
-            if line == "":
-                empty_count += 1
-            else:
-                empty_count = 0
-                lines.append(line)
-        except EOFError:
+        line = await _ainput()
+        if line is None:
             break
+        if line == "":
+            empty_count += 1
+        else:
+            empty_count = 0
+            lines.append(line)
     
     user_answer = "\n".join(lines).strip()
-    
-    if not user_answer:
-        user_answer = "(No answer provided)"
-    
-    # Create exchange record
-    exchange = {
+    return user_answer or "(No answer provided)"
+
+
+def _make_exchange(idx: int, question: str, answer: str) -> dict:
+    """Create the exchange record for one answered question."""
+    return {
         "question_num": idx + 1,
         "question": question,
-        "answer": user_answer,
+        "answer": answer,
         "timestamp": datetime.now().isoformat()
     }
+
+
+async def collect_answers(state: InterviewState) -> dict:
+    """
+    NODE 2 (bulk mode): Collect answers to all remaining questions
     
-    return {"exchanges": [exchange]}
+    No feedback in between - every answer is evaluated afterwards
+    in a single LLM call (see batch_evaluate). Each answer is
+    checkpointed as soon as it's typed, so Ctrl+C loses nothing.
+    """
+    questions = state["questions"]
+    total = len(questions)
+    exchanges = []
+    
+    for idx in range(state["current_index"], total):
+        _print_question(idx, questions[idx], total)
+        exchanges.append(_make_exchange(idx, questions[idx], await _read_answer()))
+        await asyncio.to_thread(save_checkpoint, {
+            **state,
+            "exchanges": merge_exchanges(state["exchanges"], exchanges),
+            "current_index": idx + 1
+        })
+    
+    return {"exchanges": exchanges, "current_index": total}
 
 
-def analyze_answer(state: InterviewState) -> dict:
+async def analyze_answer(state: InterviewState) -> dict:
     """
     NODE 3: Analyze the answer with LLM
     
@@ -258,22 +534,113 @@ def analyze_answer(state: InterviewState) -> dict:
     llm = get_llm()
     last_exchange = state["exchanges"][-1]
     
-    print("\n⏳ Analyzing your response...")
-    
-    response = llm.invoke([
-        SystemMessage(content="""You are an expert interview coach. 
-        Analyze this interview answer and provide structured feedback.
+    # Similar question + answer analyzed before? Reuse that feedback
+    cache = get_analyze_cache()
+    cached = None
+    if cache:
+        prompt = f"{last_exchange['question']}\n{last_exchange['answer']}"
+        vector = await get_embeddings().aembed_query(prompt)
+        cached = cache.query(vector, _analyze_cache_namespace())
+    
+    if cached:
+        print("♻️  Similar answer found - reusing its feedback")
+        content = cached["response"]
+    else:
+        # Stream the feedback as it's generated (give_feedback won't repeat it)
+        print("\n" + "-" * 60)
+        chunks = []
+        async for chunk in llm.astream(_analysis_messages(last_exchange)):
+            sys.stdout.write(chunk.content)
+            sys.stdout.flush()
+            chunks.append(chunk.content)
+        print("\n" + "-" * 60)
         
-        Score the answer from 1-10 based on:
-        - Clarity and structure
-        - Relevance to the question
-        - Specific examples provided
-        - Technical accuracy (if applicable)
-        - Communication quality
+        content = "".join(chunks)
+        if cache:
+            cache.add(prompt, content, vector, _analyze_cache_namespace())
+    
+    # Parse the response
+    score, weak_area = _parse_analysis(content)
+    
+    # Build return updates (the exchange update is merged by question_num)
+    result = {
+        "exchanges": [{
+            "question_num": last_exchange["question_num"],
+            "score": score,
+            "feedback": content,
+            "streamed": not cached
+        }],
+        "scores": [score]
+    }
+    
+    if weak_area:
+        result["weak_areas"] = [weak_area]
+    
+    return result
+
+
+async def analyze_answers_batch(state: InterviewState) -> dict:
+    """
+    NODE 3b (bulk mode): Analyze every unscored answer concurrently
+    
+    Fallback for batch_evaluate: one prompt per exchange, sent in
+    parallel with llm.abatch - the whole batch takes about as long
+    as the slowest answer.
+    """
+    llm = get_llm()
+    pending = [ex for ex in state["exchanges"] if "score" not in ex]
+    
+    print(f"\n⏳ Analyzing {len(pending)} answers...")
+    
+    responses = await llm.abatch(
+        [_analysis_messages(ex) for ex in pending],
+        config={"max_concurrency": BotConfig.BATCH_CONCURRENCY}
+    )
+    parsed = [_parse_analysis(response.content) for response in responses]
+    
+    return {
+        "exchanges": [
+            {"question_num": ex["question_num"], "score": score, "feedback": response.content}
+            for ex, response, (score, _) in zip(pending, responses, parsed)
+        ],
+        "scores": [score for score, _ in parsed],
+        "weak_areas": [area for _, area in parsed if area]
+    }
+
+
+async def batch_evaluate(state: InterviewState) -> dict:
+    """
+    NODE 3a (bulk mode): Score every unscored answer in ONE LLM call
+    
+    All question/answer pairs go out as one JSON list and come back
+    as one JSON list of evaluations. If the reply doesn't line up
+    with the answers, nothing is stored and analyze_batch takes over.
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage
+    
+    pending = [ex for ex in state["exchanges"] if "score" not in ex]
+    if not pending:
+        return {}
+    
+    print(f"\n⏳ Evaluating {len(pending)} answers...")
+    
+    llm = get_llm().bind(response_format={"type": "json_object"})
+    items = [
+        {"question_num": ex["question_num"], "question": ex["question"], "answer": ex["answer"]}
+        for ex in pending
+    ]
+    
+    response = await llm.ainvoke([
+        SystemMessage(content="""You are an expert interview coach.
+        Score each of the following interview answers from 1-10 based on
+        clarity and structure, relevance, specific examples, technical
+        accuracy (if applicable) and communication quality.
         
-        Format your response EXACTLY like this:
-        SCORE: [number 1-10]
+        Return JSON: {"evaluations": [{"question_num": <int>, "score": <1-10>,
+        "feedback": "<text>", "weak_area": "<skill or none>"}, ...]}
+        with one evaluation per answer, in the same order.
         
+        Format each "feedback" like this:
         STRENGTHS:
         • [specific strength 1]
         • [specific strength 2]
@@ -284,53 +651,67 @@ def analyze_answer(state: InterviewState) -> dict:
         
         PRO TIP: [one insider tip for this type of question]
         
-        WEAK_AREA: [if score < 7, name ONE skill to work on, e.g., "using specific examples", "structuring responses with STAR", "technical depth". If score >= 7, write "none"]
+        "weak_area": if score < 7, name ONE skill to work on, e.g., "using specific examples", "structuring responses with STAR", "technical depth". If score >= 7, write "none"
         """),
+        HumanMessage(content=json.dumps(items))
+    ])
+    
+    # API errors propagate; only a malformed reply falls back to analyze_batch
+    try:
+        evaluations = json.loads(response.content)["evaluations"]
+        parsed = [
+            (max(1, min(10, int(ev["score"]))), str(ev["feedback"]), str(ev.get("weak_area") or "none").strip())
+            for ev in evaluations
+        ]
+        returned = [ev["question_num"] for ev in evaluations]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        print(f"⚠️  Couldn't parse the batch evaluation ({type(e).__name__}: {e}) - analyzing one by one")
+        return {}
+    
+    if returned != [ex["question_num"] for ex in pending]:
+        print("⚠️  Batch evaluation didn't match the answers - analyzing one by one")
+        return {}
+    
+    return {
+        "exchanges": [
+            {"question_num": ex["question_num"], "score": score, "feedback": f"SCORE: {score}\n\n{feedback}"}
+            for ex, (score, feedback, _) in zip(pending, parsed)
+        ],
+        "scores": [score for score, _, _ in parsed],
+        "weak_areas": [
+            area for _, _, area in parsed if area.lower() not in {'none', 'n/a', '-'}
+        ]
+    }
+
+
+def _analysis_messages(exchange: dict) -> list:
+    """Build the analyzer prompt for one question/answer exchange."""
+    from langchain_core.messages import HumanMessage
+    
+    return [
+        _analyzer_sys(),
         HumanMessage(content=f"""
-        Interview Question: {last_exchange['question']}
+        Interview Question: {exchange['question']}
         
-        Candidate's Answer: {last_exchange['answer']}
+        Candidate's Answer: {exchange['answer']}
         
         Provide your analysis now.
         """)
-    ])
-    
-    # Parse the response
-    content = response.content
-    score = 5  # default
-    weak_area = None
-    
-    for line in content.split('\n'):
-        line = line.strip()
-        if line.startswith('SCORE:'):
-            try:
-                score_text = line.split(':')[1].strip()
-                # Handle formats like "7/10" or just "7"
-                score = int(score_text.split('/')[0].strip())
-                score = max(1, min(10, score))  # Clamp to 1-10
-            except:
-                score = 5
-        elif line.startswith('WEAK_AREA:'):
-            area = line.split(':', 1)[1].strip()
-            if area.lower() not in ['none', 'n/a', '-']:
-                weak_area = area
-    
-    # Store feedback in the exchange
-    state["exchanges"][-1]["score"] = score
-    state["exchanges"][-1]["feedback"] = content
-    
-    # Build return updates
-    result = {
-        "scores": state.get("scores", []) + [score]
-    }
+    ]
+
+
+def _parse_analysis(content: str) -> tuple:
+    """Extract (score, weak_area_or_None) from the analyzer's response."""
+    m = _SCORE_RE.search(content)
+    score = max(1, min(10, int(m.group(1)))) if m else 5  # Clamp to 1-10
     
-    if weak_area:
-        result["weak_areas"] = state.get("weak_areas", []) + [weak_area]
+    wm = _WEAK_RE.search(content)
+    weak_area = wm.group(1) if wm and wm.group(1).lower() not in {'none', 'n/a', '-'} else None
     
-    return result
+    return score, weak_area
 
 
-def give_feedback(state: InterviewState) -> dict:
+async def give_feedback(state: InterviewState) -> dict:
     """
     NODE 4: Present feedback and ask to continue
     
@@ -338,18 +719,49 @@ def give_feedback(state: InterviewState) -> dict:
     - Goal: Help user improve
     - Feedback: Display analysis + get continuation signal
     """
-    last_exchange = state["exchanges"][-1]
-    score = last_exchange.get("score", 5)
-    feedback = last_exchange.get("feedback", "Analysis not available.")
+    _show_feedback(state["exchanges"][-1])
+    
+    # Check if more questions available
+    new_index = state["current_index"] + 1
+    remaining = len(state["questions"]) - new_index
+    
+    if remaining > 0:
+        print(f"\n📋 {remaining} question(s) remaining")
+        continue_input = await _ainput("➡️  Continue to next question? (yes/no): ")
+        wants_continue = continue_input is not None and continue_input.strip().lower() in ['yes', 'y', '']
+    else:
+        print("\n📝 All questions completed!")
+        wants_continue = False
+    
+    return {
+        "current_index": new_index,
+        "user_wants_continue": wants_continue
+    }
+
+
+def review_answers(state: InterviewState) -> dict:
+    """
+    NODE 4 (bulk mode): Replay the feedback for every answer
+    
+    Everything was analyzed in one batch, so this just walks
+    through the results stored in state - no API calls.
+    """
+    for exchange in state["exchanges"]:
+        print(f"\n🎤 Q{exchange['question_num']}: {exchange['question']}")
+        _show_feedback(exchange, replay=True)
+    
+    return {"user_wants_continue": False}
+
+
+def _show_feedback(exchange: dict, replay: bool = False):
+    """Print the score bar and feedback for one exchange."""
+    score = exchange.get("score", 5)
+    feedback = exchange.get("feedback", "Analysis not available.")
     
     print("\n" + "=" * 60)
     print("📊 FEEDBACK")
     print("=" * 60)
     
-    # Visual score bar
-    filled = "█" * score
-    empty = "░" * (10 - score)
-    
     if score >= 8:
         emoji = "🌟"
         rating = "Excellent!"
@@ -363,30 +775,28 @@ def give_feedback(state: InterviewState) -> dict:
         emoji = "📚"
         rating = "Keep Practicing"
     
-    print(f"\n{emoji} Score: [{filled}{empty}] {score}/10 - {rating}\n")
-    print("-" * 60)
-    print(feedback)
-    print("-" * 60)
+    print(f"\n{emoji} Score: [{_BARS[score]}] {score}/10 - {rating}\n")
     
-    # Check if more questions available
-    new_index = state["current_index"] + 1
-    remaining = len(state["questions"]) - new_index
-    
-    if remaining > 0:
-        print(f"\n📋 {remaining} question(s) remaining")
-        continue_input = input("➡️  Continue to next question? (yes/no): ").strip().lower()
-        wants_continue = continue_input in ['yes', 'y', '']
-    else:
-        print("\n📝 All questions completed!")
-        wants_continue = False
+    # Already on screen if it was streamed during analysis
+    if replay or not exchange.get("streamed"):
+        print("-" * 60)
+        print(feedback)
+        print("-" * 60)
+
+
+async def persist_checkpoint(state: InterviewState) -> dict:
+    """
+    NODE: Save the state to disk after every answer
     
-    return {
-        "current_index": new_index,
-        "user_wants_continue": wants_continue
-    }
+    Runs in parallel with the analyzer, so the disk write
+    overlaps with the LLM call instead of adding to it.
+    """
+    # Safe to write from a thread: nodes never mutate state in place
+    await asyncio.to_thread(save_checkpoint, dict(state))
+    return {}
 
 
-def wrap_up_session(state: InterviewState) -> dict:
+async def wrap_up_session(state: InterviewState) -> dict:
     """
     NODE 5: Summarize session and provide final advice
     
@@ -395,6 +805,8 @@ def wrap_up_session(state: InterviewState) -> dict:
     - Memory: Read all exchanges for summary
     - Reasoning: LLM generates personalized advice
     """
+    from langchain_core.messages import HumanMessage, SystemMessage
+    
     llm = get_llm()
     
     print("\n" + "=" * 60)
@@ -407,9 +819,15 @@ def wrap_up_session(state: InterviewState) -> dict:
     
     # Performance statistics
     if scores:
-        avg_score = sum(scores) / len(scores)
-        best_score = max(scores)
-        worst_score = min(scores)
+        if HAS_NUMPY:
+            import numpy as np
+            
+            arr = np.asarray(scores, dtype=np.int8)
+            avg_score, best_score, worst_score = float(arr.mean()), int(arr.max()), int(arr.min())
+        else:
+            avg_score = sum(scores) / len(scores)
+            best_score = max(scores)
+            worst_score = min(scores)
         
         print(f"\n📊 Performance Summary")
         print(f"   ├─ Questions answered: {len(scores)}")
@@ -420,23 +838,20 @@ def wrap_up_session(state: InterviewState) -> dict:
     # Score distribution
     if scores:
         print(f"\n📈 Score Distribution")
-        for i, (exchange, score) in enumerate(zip(exchanges, scores), 1):
-            bar = "█" * score + "░" * (10 - score)
-            print(f"   Q{i}: [{bar}] {score}/10")
+        for i, score in enumerate(scores, 1):
+            print(f"   Q{i}: [{_BARS[score]}] {score}/10")
     
     # Weak areas
     if weak_areas:
-        unique_areas = list(set(weak_areas))
         print(f"\n🎯 Areas to Practice")
-        for area in unique_areas:
-            count = weak_areas.count(area)
+        for area, count in Counter(weak_areas).most_common():
             print(f"   • {area}" + (f" (×{count})" if count > 1 else ""))
     
     # Generate personalized advice
     print(f"\n💡 Coach's Final Notes")
     print("-" * 40)
     
-    response = llm.invoke([
+    response = await llm.ainvoke([
         SystemMessage(content="""You are an encouraging interview coach.
         Based on this practice session, provide:
         
@@ -484,6 +899,20 @@ def should_continue(state: InterviewState) -> Literal["ask_question", "wrap_up"]
     return "ask_question"
 
 
+def choose_mode(state: InterviewState) -> Literal["ask_question", "collect_answers"]:
+    """Route to the interactive loop or to bulk answer collection."""
+    if BotConfig.MODE == "bulk":
+        return "collect_answers"
+    return "ask_question"
+
+
+def after_batch_evaluate(state: InterviewState) -> Literal["analyze_batch", "review"]:
+    """Fall back to per-answer analysis if the single-call evaluation failed."""
+    if any("score" not in ex for ex in state["exchanges"]):
+        return "analyze_batch"
+    return "review"
+
+
 # ============================================================================
 # GRAPH ASSEMBLY
 # ============================================================================
@@ -493,12 +922,19 @@ def build_interview_graph():
     Assemble the LangGraph state machine.
     
     Flow:
-    generate_questions → ask_question → analyze → feedback 
-                              ↑                        │
-                              └────── (if continue) ───┘
-                                             │
-                                      (if done) → wrap_up → END
+    generate_questions → ask_question ─┬→ analyze ─┬→ feedback 
+                              ↑         └→ persist ─┘      │
+                              └──────── (if continue) ─────┘
+                                                           │
+                                                    (if done) → wrap_up → END
+    
+    Bulk mode (BotConfig.MODE = "bulk"):
+    generate_questions → collect_answers → batch_evaluate ──────────→ review → wrap_up → END
+                         (checkpoints each   └→ analyze_batch ─┘
+                          answer itself)     (if the one-call evaluation failed)
     """
+    from langgraph.graph import StateGraph, END
+    
     # Create the graph with our state type
     workflow = StateGraph(InterviewState)
     
@@ -508,14 +944,46 @@ def build_interview_graph():
     workflow.add_node("analyze_answer", analyze_answer)
     workflow.add_node("give_feedback", give_feedback)
     workflow.add_node("wrap_up", wrap_up_session)
+    workflow.add_node("persist", persist_checkpoint)
+    
+    # Bulk mode nodes
+    workflow.add_node("collect_answers", collect_answers)
+    workflow.add_node("batch_evaluate", batch_evaluate)
+    workflow.add_node("analyze_batch", analyze_answers_batch)
+    workflow.add_node("review", review_answers)
     
     # Set the entry point
     workflow.set_entry_point("generate_questions")
     
     # Add linear edges
-    workflow.add_edge("generate_questions", "ask_question")
+    workflow.add_conditional_edges(
+        "generate_questions",
+        choose_mode,
+        {
+            "ask_question": "ask_question",
+            "collect_answers": "collect_answers"
+        }
+    )
+    # Fan out: analyze and persist each answer in parallel,
+    # then wait for both before giving feedback
     workflow.add_edge("ask_question", "analyze_answer")
-    workflow.add_edge("analyze_answer", "give_feedback")
+    workflow.add_edge("ask_question", "persist")
+    workflow.add_edge(["analyze_answer", "persist"], "give_feedback")
+    
+    # Bulk mode: collect everything, evaluate in one call, then review
+    # (analyze_batch is the per-answer fallback). persist stays out of
+    # it - it is the interactive join's second input
+    workflow.add_edge("collect_answers", "batch_evaluate")
+    workflow.add_conditional_edges(
+        "batch_evaluate",
+        after_batch_evaluate,
+        {
+            "analyze_batch": "analyze_batch",
+            "review": "review"
+        }
+    )
+    workflow.add_edge("analyze_batch", "review")
+    workflow.add_edge("review", "wrap_up")
     
     # Add THE LOOP - conditional edge from feedback
     workflow.add_conditional_edges(
@@ -548,8 +1016,12 @@ def save_checkpoint(state: dict, filename: str = None):
     # Convert state to serializable format
     save_state = {k: v for k, v in state.items()}
     
-    with open(filename, 'w') as f:
-        json.dump(save_state, f, indent=2, default=str)
+    if orjson:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(save_state, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(save_state, f, indent=2, default=str)
     
     return filename
 
@@ -562,6 +1034,8 @@ def load_checkpoint(filename: str = None) -> dict:
     if not Path(filename).exists():
         return None
     
+    if orjson:
+        return orjson.loads(Path(filename).read_bytes())
     with open(filename, 'r') as f:
         return json.load(f)
 
@@ -577,7 +1051,11 @@ def save_session_report(state: dict):
     scores = state.get("scores", [])
     exchanges = state.get("exchanges", [])
     
-    report = f"""# Interview Practice Session Report
+    avg_score = f"{sum(scores) / len(scores):.1f}/10" if scores else "N/A"
+    score_range = f"{min(scores)} - {max(scores)}" if scores else "N/A"
+    
+    # Collect the report in parts and join once at the end
+    parts = [f"""# Interview Practice Session Report
 
 **Company:** {state.get('company', 'N/A')}
 **Position:** {state.get('position', 'N/A')}
@@ -589,18 +1067,18 @@ def save_session_report(state: dict):
 ## Performance Summary
 
 - **Questions Completed:** {len(scores)}
-- **Average Score:** {sum(scores)/len(scores):.1f}/10 if scores else "N/A"
-- **Score Range:** {min(scores) if scores else 0} - {max(scores) if scores else 0}
+- **Average Score:** {avg_score}
+- **Score Range:** {score_range}
 
 ---
 
 ## Question-by-Question Breakdown
 
-"""
+"""]
     
     for i, exchange in enumerate(exchanges, 1):
         score = exchange.get('score', 'N/A')
-        report += f"""### Question {i}
+        parts.append(f"""### Question {i}
 
 **Q:** {exchange.get('question', 'N/A')}
 
@@ -614,26 +1092,25 @@ def save_session_report(state: dict):
 
 ---
 
-"""
+""")
     
     # Weak areas summary
     weak_areas = state.get("weak_areas", [])
     if weak_areas:
-        report += """## Areas for Improvement
-
-"""
-        for area in set(weak_areas):
-            report += f"- {area}\n"
+        parts.append("## Areas for Improvement\n\n")
+        parts.extend(
+            f"- {area}" + (f" (×{count})" if count > 1 else "") + "\n"
+            for area, count in Counter(weak_areas).most_common()
+        )
     
-    report += f"""
+    parts.append("""
 ---
 
 *Generated by AI Agents Bootcamp - Day 3*
 *https://github.com/DoraSzasz/ai-agents-bootcamp*
-"""
+""")
     
-    with open(filename, 'w') as f:
-        f.write(report)
+    filename.write_text("".join(parts), encoding="utf-8")
     
     return filename
 
@@ -642,6 +1119,21 @@ def save_session_report(state: dict):
 # MAIN EXECUTION
 # ============================================================================
 
+async def _amain(initial_state: dict) -> dict:
+    """
+    Build and run the graph on the event loop.
+    
+    Every node that waits on the network or on stdin is async
+    (stdin is read in a worker thread), so the loop never blocks.
+    """
+    app = build_interview_graph()
+    try:
+        return await app.ainvoke(initial_state)
+    finally:
+        # The pooled clients belong to this event loop; don't leak them
+        await close_llms()
+
+
 def main():
     """Run the interview practice bot."""
     
@@ -651,12 +1143,14 @@ def main():
     print("=" * 60)
     
     # Validate setup
+    check_dependencies()
     validate_api_key()
     
     # Show configuration
     print(f"\n📍 Company:    {BotConfig.COMPANY}")
     print(f"💼 Position:   {BotConfig.POSITION}")
     print(f"📊 Difficulty: {BotConfig.DIFFICULTY}")
+    print(f"🔁 Mode:       {BotConfig.MODE}")
     print(f"\n(Edit BotConfig in the script to customize)")
     
     # Check for existing checkpoint
@@ -688,25 +1182,26 @@ def main():
             "session_complete": False
         }
     
-    # Build and run the graph
-    app = build_interview_graph()
+    checkpoint_path = BotConfig.OUTPUT_DIR / BotConfig.CHECKPOINT_FILE
+    run_started = time.time()
     
     try:
-        result = app.invoke(initial_state)
+        result = asyncio.run(_amain(initial_state))
         
         # Save session report
         report_path = save_session_report(result)
         print(f"\n💾 Session report saved: {report_path}")
         
         # Clean up checkpoint
-        checkpoint_path = BotConfig.OUTPUT_DIR / BotConfig.CHECKPOINT_FILE
         if checkpoint_path.exists():
             checkpoint_path.unlink()
         
     except KeyboardInterrupt:
         print("\n\n⏸️  Session interrupted!")
-        # Save checkpoint for resume
-        save_checkpoint(initial_state)
+        # Every answer is checkpointed as it comes in; only fall back
+        # to the initial state if nothing was saved during this run
+        if not checkpoint_path.exists() or checkpoint_path.stat().st_mtime < run_started:
+            save_checkpoint(initial_state)
         print(f"💾 Progress saved. Run again to resume.")
     
     print("\n✅ Good luck with your interview!\n")
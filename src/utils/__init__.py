@@ -9,6 +9,7 @@ from .helpers import (
     validate_api_key,
     AgentMemory
 )
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "ensure_output_dir",
@@ -17,5 +18,6 @@ __all__ = [
     "print_header",
     "print_step",
     "validate_api_key",
-    "AgentMemory"
+    "AgentMemory",
+    "SemanticCache"
 ]
@@ -0,0 +1,113 @@
+"""
+==========================================================
+Semantic Response Cache for AI Agents Bootcamp
+==========================================================
+Reuse an LLM response when a new prompt means (almost) the
+same thing as one we've already paid for.
+
+Prompts are compared by cosine similarity of their embeddings,
+only against entries in the same namespace (e.g. a hash of the
+model and system prompt), so changing either never serves stale
+responses. The embeddings are computed by the caller, so this
+module only needs numpy (imported on first use).
+"""
+
+import os
+import json
+import time
+from typing import Optional
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache persisted as JSON lines.
+
+    Each line is {prompt, response, vector, namespace, ts}. Entries
+    older than ttl_seconds are ignored on load, so stale feedback
+    ages out.
+    """
+
+    def __init__(
+        self,
+        path: str = "outputs/analyze_cache.jsonl",
+        threshold: float = 0.92,
+        ttl_seconds: float = 30 * 24 * 3600
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+
+        self.entries: list[dict] = []
+        self._matrices: dict = {}  # namespace -> (entries, normalized embeddings)
+
+        if os.path.exists(path):
+            cutoff = time.time() - ttl_seconds
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn last line from an interrupted write
+                    if entry.get("ts", 0) >= cutoff:
+                        self.entries.append(entry)
+
+    def _build_matrix(self, namespace: str) -> tuple:
+        """Stack one namespace's embeddings into a normalized matrix."""
+        import numpy as np
+
+        entries = [e for e in self.entries if e.get("namespace") == namespace]
+        if not entries:
+            return entries, None
+        matrix = np.array([e["vector"] for e in entries], dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        return entries, matrix
+
+    def query(
+        self,
+        vector: list,
+        namespace: str,
+        threshold: Optional[float] = None
+    ) -> Optional[dict]:
+        """
+        Return the closest stored entry, if it is similar enough.
+
+        Args:
+            vector: Embedding of the new prompt
+            namespace: Only entries added under this namespace can match
+            threshold: Minimum cosine similarity (default: self.threshold)
+
+        Returns:
+            The matching {prompt, response, namespace, ts} entry, or None
+        """
+        import numpy as np
+
+        if namespace not in self._matrices:
+            self._matrices[namespace] = self._build_matrix(namespace)
+        entries, matrix = self._matrices[namespace]
+        if matrix is None:
+            return None
+
+        query = np.asarray(vector, dtype=np.float32)
+        query /= np.linalg.norm(query)
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+
+        if similarities[best] < (self.threshold if threshold is None else threshold):
+            return None
+        return {k: v for k, v in entries[best].items() if k != "vector"}
+
+    def add(self, prompt: str, response: str, vector: list, namespace: str):
+        """Store a response under namespace and append it to the cache file."""
+        entry = {
+            "prompt": prompt,
+            "response": response,
+            "vector": list(vector),
+            "namespace": namespace,
+            "ts": time.time()
+        }
+        self.entries.append(entry)
+        self._matrices.pop(namespace, None)
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
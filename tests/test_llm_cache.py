@@ -0,0 +1,61 @@
+"""Tests for the Day 1 agent's on-disk LLM cache and report index."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("dotenv")
+
+SCRIPT = Path(__file__).resolve().parent.parent / "src" / "01_first_agent.py"
+
+
+@pytest.fixture(scope="module")
+def agent_module():
+    spec = importlib.util.spec_from_file_location("first_agent", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_semantic_lookup_hits_within_namespace(agent_module, tmp_path):
+    cache = agent_module.LLMCache(str(tmp_path / "cache.sqlite"))
+    cache.add_embedding("stripe-key", [1.0, 0.0, 0.0], namespace="gpt-4o|markdown")
+
+    assert cache.most_similar([1.0, 0.0, 0.0], 0.93, namespace="gpt-4o|markdown") == "stripe-key"
+
+
+def test_semantic_lookup_misses_other_prompt_or_mode(agent_module, tmp_path):
+    cache = agent_module.LLMCache(str(tmp_path / "cache.sqlite"))
+    cache.add_embedding("stripe-key", [1.0, 0.0, 0.0], namespace="gpt-4o|markdown")
+
+    # Same company name (similarity 1.0), different model/prompt/output mode
+    assert cache.most_similar([1.0, 0.0, 0.0], 0.93, namespace="gpt-4o|structured") is None
+    assert cache.most_similar([1.0, 0.0, 0.0], 0.93, namespace="gpt-4o-mini|markdown") is None
+
+
+def test_research_namespace_tracks_output_mode(agent_module, monkeypatch):
+    agent_cls = agent_module.CompanyResearchAgent
+    config = agent_module.AgentConfig
+
+    monkeypatch.setattr(config, "STRUCTURED_OUTPUT", False)
+    markdown = agent_cls._research_namespace()
+    monkeypatch.setattr(config, "STRUCTURED_OUTPUT", True)
+    structured = agent_cls._research_namespace()
+    monkeypatch.setattr(config, "MODEL", "some-other-model")
+
+    assert len({markdown, structured, agent_cls._research_namespace()}) == 3
+
+
+
+def test_report_index_keeps_one_row_per_company(agent_module, tmp_path):
+    path = str(tmp_path / "report_index.npz")
+    index = agent_module.ReportIndex(path)
+    index.add("Stripe", "stripe_1.md", [1.0, 0.0, 0.0])
+    index.add("stripe", "stripe_2.md", [1.0, 0.1, 0.0])
+    index.add("Adyen", "adyen.md", [0.9, 0.2, 0.0])
+
+    reloaded = agent_module.ReportIndex(path)
+    assert reloaded.paths == ["stripe_2.md", "adyen.md"]
+    assert reloaded.vectors.shape[0] == 2
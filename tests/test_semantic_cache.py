@@ -0,0 +1,28 @@
+"""Tests for the Day 3 analyzer's semantic response cache."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils import SemanticCache  # noqa: E402
+
+
+def test_query_hits_within_namespace(tmp_path):
+    cache = SemanticCache(str(tmp_path / "cache.jsonl"))
+    cache.add("q\na", "feedback", [1.0, 0.0, 0.0], namespace="gpt-4o|prompt-v1")
+
+    assert cache.query([1.0, 0.0, 0.0], namespace="gpt-4o|prompt-v1")["response"] == "feedback"
+
+
+def test_query_misses_other_model_or_prompt(tmp_path):
+    path = str(tmp_path / "cache.jsonl")
+    SemanticCache(path).add("q\na", "feedback", [1.0, 0.0, 0.0], namespace="gpt-4o|prompt-v1")
+
+    reloaded = SemanticCache(path)
+    assert reloaded.query([1.0, 0.0, 0.0], namespace="gpt-4o|prompt-v2") is None
+    assert reloaded.query([1.0, 0.0, 0.0], namespace="gpt-4o-mini|prompt-v1") is None